@@ -0,0 +1,112 @@
+"""
+Analysis Cache
+Serves repeated resume analyses without re-running the pipeline
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CachedAnalyzer:
+    """
+    Exact-match result cache in front of a ResumeAnalyzer
+    
+    Keyed by SHA-256 of the resume content, job description and required
+    skills. Near-duplicate resumes are deliberately not served from cache:
+    results carry the candidate's own parsed fields and skill matches.
+    """
+    
+    def __init__(self, analyzer, max_entries: int = 1024):
+        """
+        Initialize cache
+        
+        Args:
+            analyzer: ResumeAnalyzer instance to wrap
+            max_entries: Maximum cached results
+        """
+        self.analyzer = analyzer
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        # digest -> result dict (LRU order)
+        self._exact: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+    
+    def analyze(self,
+                job_description: str,
+                resume_text: Optional[str] = None,
+                resume_bytes: Optional[bytes] = None,
+                resume_extension: str = '',
+                required_skills: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Analyze resume against job description, reusing cached results
+        
+        Args:
+            job_description: Job description text
+            resume_text: Resume text
+            resume_bytes: Raw resume file content (alternative to resume_text)
+            resume_extension: File extension of resume_bytes (e.g. '.pdf')
+            required_skills: Optional list of required skills
+        
+        Returns:
+            Analysis result dictionary (same shape as AnalysisResult.to_dict())
+        """
+        if resume_bytes:
+            kind = b'file' + resume_extension.lower().encode('utf-8')
+            content = resume_bytes
+        elif resume_text:
+            kind = b'text'
+            content = resume_text.encode('utf-8')
+        else:
+            raise ValueError("Either resume_bytes or resume_text must be provided")
+        if not job_description:
+            raise ValueError("job_description must be provided")
+        
+        # Results depend on input kind (file parsing extracts more fields)
+        # and required skills, so those are part of the key
+        variant = hashlib.sha256(
+            kind + b'\x00' + '\x1f'.join(required_skills or []).encode('utf-8')
+        ).digest()
+        key = hashlib.sha256(
+            variant + content + b'\x00' + job_description.encode('utf-8')
+        ).digest()
+        
+        with self._lock:
+            cached = self._exact.get(key)
+            if cached is not None:
+                self._exact.move_to_end(key)
+                logger.info("Analysis cache hit (exact)")
+                return copy.deepcopy(cached)
+        
+        if resume_bytes:
+            resume_data = self.analyzer.resume_parser.parse_bytes(resume_bytes, resume_extension)
+        else:
+            resume_data = {'raw_text': resume_text}
+        job_data = self.analyzer.job_parser.parse(job_description)
+        
+        result = self.analyzer.analyze_parsed(
+            resume_data,
+            job_data,
+            required_skills=required_skills
+        ).to_dict()
+        
+        self._store_exact(key, result)
+        return copy.deepcopy(result)
+    
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._exact.clear()
+    
+    def _store_exact(self, key: bytes, result: Dict[str, Any]):
+        """Insert into the exact tier, evicting the least recently used entry"""
+        with self._lock:
+            self._exact[key] = result
+            self._exact.move_to_end(key)
+            if len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
@@ -2,26 +2,102 @@
 FastAPI REST API for Resume Screening Service
 """
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Optional, List
-import tempfile
+from typing import Optional, List, Tuple
+import asyncio
+import hashlib
+import logging
 import os
+import orjson
+import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 
 from resume_screener import ResumeAnalyzer
 from resume_screener.bias_detection import BiasDetector
 from resume_screener.explainability.enhanced_explainer import EnhancedExplainabilityEngine
 from feedback_storage import get_feedback_storage
+from analysis_cache import CachedAnalyzer
+from batch_pool import create_pool, parse_and_extract
 import uuid
 
+logger = logging.getLogger(__name__)
+
+# Feedback writes are queued and persisted in batches by a background task
+FEEDBACK_BATCH_SIZE = 32
+FEEDBACK_FLUSH_INTERVAL = 0.05  # seconds to wait for more rows before writing
+FEEDBACK_FLUSH_TIMEOUT = 5.0  # longest a reader waits for queued rows to land
+feedback_queue: Optional[asyncio.Queue] = None
+
+
+async def _feedback_writer():
+    """Drain the feedback queue, writing each batch in one transaction"""
+    storage = get_feedback_storage()
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        records = [await feedback_queue.get()]
+        deadline = loop.time() + FEEDBACK_FLUSH_INTERVAL
+        
+        while len(records) < FEEDBACK_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                records.append(await asyncio.wait_for(feedback_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # A failed batch is logged and dropped; the writer keeps draining
+        try:
+            await run_in_threadpool(storage.save_feedback_many, records)
+        except Exception as e:
+            logger.error(f"Error writing feedback batch: {e}")
+        finally:
+            for _ in records:
+                feedback_queue.task_done()
+
+
+async def _flush_feedback():
+    """Wait (bounded) for queued feedback to be written"""
+    try:
+        await asyncio.wait_for(feedback_queue.join(), FEEDBACK_FLUSH_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Timed out waiting for queued feedback to be written")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    global feedback_queue, batch_pool
+    _init_components()
+    feedback_queue = asyncio.Queue()
+    # Spawned workers: forking after torch has started threads is unsafe
+    batch_pool = create_pool(use_spacy=False)
+    writer = asyncio.create_task(_feedback_writer())
+    
+    yield
+    
+    # Flush pending feedback before stopping the writer
+    await _flush_feedback()
+    writer.cancel()
+    batch_pool.shutdown(wait=False, cancel_futures=True)
+    get_feedback_storage().close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Resume Screener API",
     description="Intelligent resume screening with NLP and bias detection",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -33,10 +109,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
-analyzer = ResumeAnalyzer(use_sbert=True, use_spacy=False)
-bias_detector = BiasDetector()
-enhanced_explainer = EnhancedExplainabilityEngine()
+# Compress large JSON payloads (batch and enhanced results are highly repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# Components are built at startup (see lifespan), not at import: batch workers
+# are spawned and re-import the main module, and must not load SBERT again
+analyzer: Optional[ResumeAnalyzer] = None
+cached_analyzer: Optional[CachedAnalyzer] = None
+bias_detector: Optional[BiasDetector] = None
+enhanced_explainer: Optional[EnhancedExplainabilityEngine] = None
+
+# Shared parsers/extractor (stateless, safe to use across requests)
+resume_parser = None
+job_parser = None
+skill_extractor = None
+
+# The skill database is static, so /api/skills is rendered once at startup
+SKILLS_PAYLOAD: bytes = b''
+SKILLS_ETAG = ''
+
+# Process pool for CPU-bound batch parsing and skill extraction
+batch_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_components():
+    """Build the analysis components shared by all requests"""
+    global analyzer, cached_analyzer, bias_detector, enhanced_explainer
+    global resume_parser, job_parser, skill_extractor, SKILLS_PAYLOAD, SKILLS_ETAG
+    
+    # Set EMBEDDING_URL to a text-embeddings-inference server to embed out of process,
+    # and QUANTIZE_EMBEDDINGS=1 to run SBERT with int8 quantization (changes scores)
+    analyzer = ResumeAnalyzer(
+        use_sbert=True,
+        use_spacy=False,
+        quantize_embeddings=os.getenv('QUANTIZE_EMBEDDINGS', '').lower() in ('1', 'true', 'yes'),
+        embedding_url=os.getenv('EMBEDDING_URL')
+    )
+    cached_analyzer = CachedAnalyzer(analyzer)
+    bias_detector = BiasDetector()
+    enhanced_explainer = EnhancedExplainabilityEngine()
+    
+    resume_parser = analyzer.resume_parser
+    job_parser = analyzer.job_parser
+    skill_extractor = analyzer.skill_extractor
+    
+    SKILLS_PAYLOAD = orjson.dumps({
+        "total_skills": len(skill_extractor.all_skills),
+        "categories": dict(skill_extractor.SKILL_DATABASE)
+    })
+    SKILLS_ETAG = f'"{hashlib.sha256(SKILLS_PAYLOAD).hexdigest()[:32]}"'
+
+
+# Maximum uploads read into memory at once per batch request
+UPLOAD_READ_CONCURRENCY = 8
+
+
+async def _read_upload(upload: UploadFile) -> Tuple[bytes, str]:
+    """Read an uploaded file into memory and return its content and extension"""
+    await upload.seek(0)
+    return await upload.read(), Path(upload.filename).suffix
 
 
 # Request/Response Models
@@ -108,13 +239,15 @@ async def root():
     }
 
 
-@app.get("/health")
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "resume-screener"}
 
 
-@app.post("/api/analyze", response_model=AnalyzeResponse)
+# AnalyzeResponse documents the schema only; the result dict is returned
+# as-is to skip output validation on the hot path
+@app.post("/api/analyze", response_model=None, responses={200: {"model": AnalyzeResponse}})
 async def analyze_resume(request: AnalyzeRequest):
     """
     Analyze resume text against job description
@@ -126,13 +259,14 @@ async def analyze_resume(request: AnalyzeRequest):
         AnalyzeResponse with detailed analysis
     """
     try:
-        result = analyzer.analyze(
+        result = await run_in_threadpool(
+            cached_analyzer.analyze,
             resume_text=request.resume_text,
             job_description=request.job_description,
             required_skills=request.required_skills
         )
         
-        return AnalyzeResponse(**result.to_dict())
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
@@ -154,25 +288,18 @@ async def analyze_resume_file(
         Analysis results
     """
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(resume_file.filename).suffix) as tmp_file:
-            content = await resume_file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
+        # Parse the upload in memory
+        data, extension = await _read_upload(resume_file)
         
-        try:
-            # Analyze
-            result = analyzer.analyze(
-                resume_path=tmp_path,
-                job_description=job_description
-            )
-            
-            return JSONResponse(content=result.to_dict())
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        # Analyze
+        result = await run_in_threadpool(
+            cached_analyzer.analyze,
+            resume_bytes=data,
+            resume_extension=extension,
+            job_description=job_description
+        )
+        
+        return ORJSONResponse(content=result)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
@@ -229,34 +356,49 @@ async def batch_analyze(
         List of analysis results sorted by score
     """
     try:
-        results = []
+        # Read uploads concurrently, bounding how many are buffered at once
+        read_semaphore = asyncio.Semaphore(UPLOAD_READ_CONCURRENCY)
         
-        for resume_file in resume_files:
-            # Save temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(resume_file.filename).suffix) as tmp_file:
-                content = await resume_file.read()
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
-            
-            try:
-                # Analyze
-                result = analyzer.analyze(
-                    resume_path=tmp_path,
-                    job_description=job_description
-                )
-                
-                result_dict = result.to_dict()
-                result_dict['filename'] = resume_file.filename
-                results.append(result_dict)
-                
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+        async def read_bounded(upload: UploadFile) -> Tuple[bytes, str]:
+            async with read_semaphore:
+                return await _read_upload(upload)
         
-        # Sort by score (descending)
-        results.sort(key=lambda x: x['overall_score'], reverse=True)
+        uploads = await asyncio.gather(*(read_bounded(f) for f in resume_files))
         
-        return JSONResponse(content={
+        # Parse files and extract skills across worker processes,
+        # then score them with one batched SBERT pass
+        loop = asyncio.get_running_loop()
+        parsed = await asyncio.gather(*(
+            loop.run_in_executor(batch_pool, parse_and_extract, data, extension)
+            for data, extension in uploads
+        ))
+        resume_data_list = [resume_data for resume_data, _ in parsed]
+        resume_skills_list = [skills for _, skills in parsed]
+        
+        job_data = await run_in_threadpool(job_parser.parse, job_description)
+        analysis_results = await run_in_threadpool(
+            analyzer.analyze_many,
+            resume_data_list,
+            job_data,
+            resume_skills_list=resume_skills_list
+        )
+        
+        results = []
+        for resume_file, result in zip(resume_files, analysis_results):
+            result_dict = result.to_dict()
+            result_dict['filename'] = resume_file.filename
+            results.append(result_dict)
+        
+        # Sort by score (descending); stable so ties keep upload order
+        scores = np.fromiter(
+            (r['overall_score'] for r in results),
+            dtype=np.float64,
+            count=len(results)
+        )
+        order = np.argsort(-scores, kind='stable')
+        results = [results[i] for i in order]
+        
+        return ORJSONResponse(content={
             "total_resumes": len(results),
             "results": results
         })
@@ -286,113 +428,101 @@ async def analyze_enhanced(
         - Personalized learning roadmap
     """
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(resume_file.filename).suffix) as tmp_file:
-            content = await resume_file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
+        # Parse the upload in memory
+        data, extension = await _read_upload(resume_file)
         
-        try:
-            # Get basic analysis
-            result = analyzer.analyze(
-                resume_path=tmp_path,
-                job_description=job_description
-            )
+        # Get basic analysis
+        result = await run_in_threadpool(
+            analyzer.analyze_bytes,
+            data,
+            extension,
+            job_description=job_description
+        )
+        
+        # Reuse the data parsed during the basic analysis
+        resume_data = result.resume_data
+        job_data = result.job_data
+        
+        # Generate enhanced explanation
+        enhanced_result = await run_in_threadpool(
+            enhanced_explainer.explain,
+            score_breakdown=result.score_breakdown,
+            resume_data=resume_data,
+            job_data=job_data,
+            resume_text=resume_data['raw_text']
+        )
+        
+        # Build comprehensive response
+        response = {
+            # Basic scores
+            'overall_score': result.score,
+            'confidence': result.confidence,
+            'classification': result.classification,
             
-            # Get parsed data for enhanced analysis
-            from resume_screener.parsers.document_parser import ResumeParser, JobDescriptionParser
-            resume_parser = ResumeParser()
-            job_parser = JobDescriptionParser()
+            # Enhanced explanations
+            'summary': enhanced_result.summary,
+            'score_explanations': enhanced_result.score_explanations,
             
-            resume_data = resume_parser.parse(tmp_path)
-            job_data = job_parser.parse(job_description)
+            # Skill analysis
+            'skill_analysis': [
+                {
+                    'skill_name': s.skill_name,
+                    'is_matched': s.is_matched,
+                    'importance': s.importance,
+                    'reason': s.reason,
+                    'market_demand': s.market_demand,
+                    'learning_resources': s.learning_resources,
+                    'estimated_learning_time': s.estimated_learning_time
+                }
+                for s in enhanced_result.skill_analysis
+            ],
             
-            # Generate enhanced explanation
-            enhanced_result = enhanced_explainer.explain(
-                score_breakdown=analyzer.score_breakdown,
-                resume_data=resume_data,
-                job_data=job_data,
-                resume_text=resume_data.get('text', '')
-            )
+            # ATS compatibility
+            'ats_compatibility': {
+                'overall_score': enhanced_result.ats_compatibility.overall_score,
+                'is_ats_friendly': enhanced_result.ats_compatibility.is_ats_friendly,
+                'issues': enhanced_result.ats_compatibility.issues,
+                'recommendations': enhanced_result.ats_compatibility.recommendations,
+                'formatting_score': enhanced_result.ats_compatibility.formatting_score,
+                'keyword_optimization': enhanced_result.ats_compatibility.keyword_optimization
+            },
             
-            # Build comprehensive response
-            response = {
-                # Basic scores
-                'overall_score': result.score,
-                'confidence': result.confidence,
-                'classification': result.classification,
-                
-                # Enhanced explanations
-                'summary': enhanced_result.summary,
-                'score_explanations': enhanced_result.score_explanations,
-                
-                # Skill analysis
-                'skill_analysis': [
-                    {
-                        'skill_name': s.skill_name,
-                        'is_matched': s.is_matched,
-                        'importance': s.importance,
-                        'reason': s.reason,
-                        'market_demand': s.market_demand,
-                        'learning_resources': s.learning_resources,
-                        'estimated_learning_time': s.estimated_learning_time
-                    }
-                    for s in enhanced_result.skill_analysis
-                ],
-                
-                # ATS compatibility
-                'ats_compatibility': {
-                    'overall_score': enhanced_result.ats_compatibility.overall_score,
-                    'is_ats_friendly': enhanced_result.ats_compatibility.is_ats_friendly,
-                    'issues': enhanced_result.ats_compatibility.issues,
-                    'recommendations': enhanced_result.ats_compatibility.recommendations,
-                    'formatting_score': enhanced_result.ats_compatibility.formatting_score,
-                    'keyword_optimization': enhanced_result.ats_compatibility.keyword_optimization
-                },
-                
-                # Career insights
-                'career_insights': enhanced_result.career_insights,
-                
-                # Recommendations
-                'recommendations': enhanced_result.recommendations,
-                
-                # Learning roadmap
-                'learning_roadmap': enhanced_result.learning_roadmap,
-                
-                # Industry benchmark
-                'industry_benchmark': enhanced_result.industry_benchmark,
-                
-                # Original data
-                'matched_skills': result.matched_skills,
-                'missing_skills': result.missing_skills,
-                'strengths': result.strengths,
-                'weaknesses': result.weaknesses
-            }
+            # Career insights
+            'career_insights': enhanced_result.career_insights,
             
-            return JSONResponse(content=response)
+            # Recommendations
+            'recommendations': enhanced_result.recommendations,
             
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            # Learning roadmap
+            'learning_roadmap': enhanced_result.learning_roadmap,
+            
+            # Industry benchmark
+            'industry_benchmark': enhanced_result.industry_benchmark,
+            
+            # Original data
+            'matched_skills': result.matched_skills,
+            'missing_skills': result.missing_skills,
+            'strengths': result.strengths,
+            'weaknesses': result.weaknesses
+        }
+        
+        return ORJSONResponse(content=response)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Enhanced analysis failed: {str(e)}")
 
 
 @app.get("/api/skills")
-async def get_skill_database():
+async def get_skill_database(request: Request):
     """Get the skill database"""
-    from resume_screener.parsers.skill_extractor import SkillExtractor
+    if request.headers.get("if-none-match") == SKILLS_ETAG:
+        return Response(status_code=304, headers={"ETag": SKILLS_ETAG})
     
-    extractor = SkillExtractor()
-    return {
-        "total_skills": len(extractor.all_skills),
-        "categories": {
-            category: skills 
-            for category, skills in extractor.SKILL_DATABASE.items()
-        }
-    }
+    return Response(
+        content=SKILLS_PAYLOAD,
+        media_type="application/json",
+        headers={"ETag": SKILLS_ETAG}
+    )
 
 
 @app.post("/api/feedback")
@@ -404,31 +534,15 @@ async def submit_feedback(feedback: FeedbackRequest):
         feedback: FeedbackRequest with user's feedback
         
     Returns:
-        Success status and message
+        Queued status and message (the entry is persisted in the background)
     """
     try:
-        storage = get_feedback_storage()
+        await feedback_queue.put(feedback.model_dump())
         
-        success = storage.save_feedback(
-            session_id=feedback.session_id,
-            overall_score=feedback.overall_score,
-            user_rating=feedback.user_rating,
-            was_helpful=feedback.was_helpful,
-            comments=feedback.comments,
-            resume_text=feedback.resume_text,
-            job_description=feedback.job_description,
-            matched_skills=feedback.matched_skills,
-            missing_skills=feedback.missing_skills,
-            score_breakdown=feedback.score_breakdown
-        )
-        
-        if success:
-            return {
-                "status": "success",
-                "message": "Thank you for your feedback! It helps us improve."
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save feedback")
+        return {
+            "status": "queued",
+            "message": "Thank you for your feedback! It helps us improve."
+        }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Feedback submission failed: {str(e)}")
@@ -438,6 +552,7 @@ async def submit_feedback(feedback: FeedbackRequest):
 async def get_feedback_stats():
     """Get feedback statistics"""
     try:
+        await _flush_feedback()
         storage = get_feedback_storage()
         stats = storage.get_statistics()
         return stats
@@ -449,6 +564,7 @@ async def get_feedback_stats():
 async def export_training_data():
     """Export feedback data for model training"""
     try:
+        await _flush_feedback()
         storage = get_feedback_storage()
         count = storage.export_training_data()
         return {
@@ -0,0 +1,67 @@
+"""
+Batch Worker Pool
+Runs CPU-bound resume parsing and skill extraction across processes
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Dict, Any, List
+import logging
+
+from resume_screener.parsers.document_parser import ResumeParser
+from resume_screener.parsers.skill_extractor import SkillExtractor
+
+logger = logging.getLogger(__name__)
+
+# Per-process components, built once by the pool initializer
+_resume_parser = None
+_skill_extractor = None
+
+
+def _init_worker(use_spacy: bool):
+    """Load parsing components once per worker process"""
+    global _resume_parser, _skill_extractor
+    _resume_parser = ResumeParser()
+    _skill_extractor = SkillExtractor(use_spacy=use_spacy)
+
+
+def parse_and_extract(data: bytes, extension: str) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Parse an in-memory resume file and extract its skills (runs inside a worker)
+    
+    Args:
+        data: Raw resume file content
+        extension: File extension including the dot (e.g. '.pdf')
+        
+    Returns:
+        Tuple of (parsed resume data, extracted skills)
+    """
+    resume_data = _resume_parser.parse_bytes(data, extension)
+    return resume_data, _skill_extractor.extract(resume_data['raw_text'])
+
+
+def create_pool(max_workers: Optional[int] = None, use_spacy: bool = False) -> ProcessPoolExecutor:
+    """
+    Create the worker pool
+    
+    SBERT stays in the parent process, where embeddings are computed in one
+    batch; workers only run the pure-Python parsing and skill matching.
+    Workers are spawned rather than forked: the parent has already started
+    torch's threads, which a forked child would inherit in a broken state.
+    
+    Args:
+        max_workers: Number of worker processes (defaults to CPU count)
+        use_spacy: Whether workers use spaCy for skill extraction
+        
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    logger.info(f"Starting batch worker pool with {max_workers} processes")
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(use_spacy,)
+    )
@@ -2,7 +2,9 @@
 Demo Script - Comprehensive demonstration of the Resume Screener
 """
 
-from resume_screener import ResumeAnalyzer
+import argparse
+
+from resume_screener._singletons import _get_analyzer
 from resume_screener.bias_detection import BiasDetector
 
 # Sample resume data
@@ -86,8 +88,26 @@ What We Offer:
 • Collaborative team environment
 """
 
-def main():
-    """Run comprehensive demo"""
+def load_components():
+    """Load the analyzer and bias detector (SBERT loading dominates startup)"""
+    print("📦 Initializing Resume Analyzer...")
+    analyzer = _get_analyzer()
+    bias_detector = BiasDetector()
+    print("✅ Analyzer ready!\n")
+    return analyzer, bias_detector
+
+
+def main(analyzer=None, bias_detector=None,
+         resume_path=None, job_path=None):
+    """
+    Run comprehensive demo
+    
+    Args:
+        analyzer: Preloaded ResumeAnalyzer (loaded here if None)
+        bias_detector: Preloaded BiasDetector (created here if None)
+        resume_path: Resume file to analyze (defaults to the sample resume)
+        job_path: Job description file (defaults to the sample job)
+    """
     
     print("=" * 100)
     print(" " * 30 + "🎯 AI RESUME SCREENER DEMO")
@@ -95,18 +115,21 @@ def main():
     print()
     
     # Initialize analyzer
-    print("📦 Initializing Resume Analyzer...")
-    analyzer = ResumeAnalyzer(use_sbert=True, use_spacy=False)
-    print("✅ Analyzer ready!\n")
+    if analyzer is None or bias_detector is None:
+        analyzer, bias_detector = load_components()
     
     # Analyze resume
     print("🔍 Analyzing resume against job description...")
     print("-" * 100)
     
     result = analyzer.analyze(
-        resume_text=SAMPLE_RESUME,
-        job_description=SAMPLE_JOB_DESCRIPTION
+        resume_path=resume_path,
+        resume_text=None if resume_path else SAMPLE_RESUME,
+        job_path=job_path,
+        job_description=None if job_path else SAMPLE_JOB_DESCRIPTION
     )
+    resume_text = result.resume_data['raw_text']
+    job_description = result.job_data['raw_text']
     
     # Display results
     print("\n" + "=" * 100)
@@ -194,8 +217,7 @@ def main():
     print(" " * 35 + "🛡️  BIAS DETECTION")
     print("=" * 100)
     
-    bias_detector = BiasDetector()
-    bias_results = bias_detector.detect(SAMPLE_RESUME, SAMPLE_JOB_DESCRIPTION)
+    bias_results = bias_detector.detect(resume_text, job_description)
     
     print(f"\n📊 Overall Risk Level: {bias_results['overall_risk'].upper()}")
     print(f"Resume Risk: {bias_results['resume_bias']['risk_level'].upper()}")
@@ -242,5 +264,34 @@ Next Steps:
     print("=" * 100)
 
 
+def interactive():
+    """Load models once, then analyze resume/job file pairs read from stdin"""
+    analyzer, bias_detector = load_components()
+    
+    while True:
+        try:
+            resume_path = input("Resume file (blank for sample, 'q' to quit): ").strip()
+            if resume_path.lower() in ('q', 'quit', 'exit'):
+                break
+            job_path = input("Job description file (blank for sample): ").strip()
+        except EOFError:
+            break
+        
+        try:
+            main(analyzer, bias_detector,
+                 resume_path=resume_path or None,
+                 job_path=job_path or None)
+        except Exception as e:
+            print(f"❌ Analysis failed: {e}")
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="AI Resume Screener demo")
+    parser.add_argument('-i', '--interactive', action='store_true',
+                        help="Keep the models loaded and analyze several resume/job pairs")
+    args = parser.parse_args()
+    
+    if args.interactive:
+        interactive()
+    else:
+        main()
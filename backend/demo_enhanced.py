@@ -7,9 +7,6 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from resume_screener import ResumeAnalyzer
-from resume_screener.explainability.enhanced_explainer import EnhancedExplainabilityEngine
-from resume_screener.parsers.document_parser import JobDescriptionParser
 
 # Sample job description
 JOB_DESCRIPTION = """
@@ -60,158 +57,147 @@ def main():
     print("\n🚀 ENHANCED RESUME ANALYSIS DEMO")
     print("=" * 80)
     
-    # Initialize components
+    # Initialize components (imported here: loading the package pulls in torch/SBERT)
     print("\n📦 Loading AI models...")
-    analyzer = ResumeAnalyzer(use_sbert=True, use_spacy=False)
-    enhanced_explainer = EnhancedExplainabilityEngine()
-    job_parser = JobDescriptionParser()
+    from resume_screener._singletons import (
+        _get_analyzer, _get_enhanced_explainer, _get_resume_parser, _get_jd_parser
+    )
+    analyzer = _get_analyzer()
+    enhanced_explainer = _get_enhanced_explainer()
     
     # Analyze resume
     print("✅ Models loaded!")
     print("\n📊 Analyzing resume against job description...")
     
-    # Parse job description
-    job_data = job_parser.parse(JOB_DESCRIPTION)
-    
-    # Create a temporary resume file
-    import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(SAMPLE_RESUME)
-        temp_resume_path = f.name
-    
-    try:
-        # Basic analysis
-        result = analyzer.analyze(
-            resume_path=temp_resume_path,
-            job_description=JOB_DESCRIPTION
-        )
-        
-        # Get the score breakdown from the result object
-        score_breakdown = result.score_breakdown
-        
-        # Enhanced analysis
-        from resume_screener.parsers.document_parser import ResumeParser
-        resume_parser = ResumeParser()
-        resume_data = resume_parser.parse(temp_resume_path)
-        
-        enhanced_result = enhanced_explainer.explain(
-            score_breakdown=score_breakdown,
-            resume_data=resume_data,
-            job_data=job_data,
-            resume_text=SAMPLE_RESUME
-        )
-        
-        # Display results
-        print_section("📊 OVERALL SCORE")
-        print(f"Score: {result.score:.1f}/100")
-        print(f"Confidence: {result.confidence*100:.0f}%")
-        print(f"Classification: {result.classification}")
-        print(f"\n{enhanced_result.summary}")
-        
-        # Score breakdowns
-        print_section("📈 DETAILED SCORE EXPLANATIONS")
-        for component, explanation in enhanced_result.score_explanations.items():
-            print(f"\n{component}")
-            print("-" * 80)
-            print(explanation)
-        
-        # Skill analysis
-        print_section("🎯 SKILL-BY-SKILL ANALYSIS")
-        
-        print("✅ MATCHED SKILLS:")
-        for skill in enhanced_result.skill_analysis:
-            if skill.is_matched:
-                print(f"\n  • {skill.skill_name} ({skill.importance})")
-                print(f"    {skill.reason}")
-                print(f"    Market Demand: {skill.market_demand}")
-        
-        print("\n\n❌ MISSING SKILLS:")
-        for skill in enhanced_result.skill_analysis:
-            if not skill.is_matched:
-                print(f"\n  • {skill.skill_name} ({skill.importance})")
-                print(f"    {skill.reason}")
-                print(f"    Learning Time: {skill.estimated_learning_time}")
-                print(f"    Resources:")
-                for resource in skill.learning_resources[:2]:
-                    print(f"      - {resource}")
-        
-        # ATS Compatibility
-        print_section("🤖 ATS COMPATIBILITY CHECK")
-        ats = enhanced_result.ats_compatibility
-        print(f"Overall ATS Score: {ats.overall_score:.1f}/100")
-        print(f"ATS Friendly: {'✅ YES' if ats.is_ats_friendly else '⚠️  NEEDS IMPROVEMENT'}")
-        print(f"Formatting Score: {ats.formatting_score:.1f}/100")
-        print(f"Keyword Optimization: {ats.keyword_optimization:.1f}/100")
-        
-        if ats.issues:
-            print("\n⚠️  Issues Found:")
-            for issue in ats.issues:
-                print(f"  • {issue}")
-        
-        if ats.recommendations:
-            print("\n💡 Recommendations:")
-            for rec in ats.recommendations:
-                print(f"  • {rec}")
-        
-        # Career Insights
-        print_section("💼 CAREER INSIGHTS")
-        career = enhanced_result.career_insights
-        print(f"Career Level: {career['career_level']}")
-        print(f"Role Fit: {career['role_fit']}")
-        
-        if career['growth_potential']:
-            print("\n📈 Growth Potential:")
-            for insight in career['growth_potential']:
-                print(f"  • {insight}")
-        
-        if career['alternative_roles']:
-            print("\n🔄 Alternative Roles to Consider:")
-            for role in career['alternative_roles']:
-                print(f"  • {role}")
-        
-        # Learning Roadmap
-        print_section("📚 PERSONALIZED LEARNING ROADMAP")
-        if enhanced_result.learning_roadmap:
-            current_phase = 0
-            for item in enhanced_result.learning_roadmap:
-                if item['phase'] != current_phase:
-                    current_phase = item['phase']
-                    print(f"\n🎯 PHASE {current_phase} ({item['priority']} Priority)")
-                    print("-" * 80)
-                
-                print(f"\n  📖 {item['skill']}")
-                print(f"     Time: {item['estimated_time']} | Demand: {item['market_demand']}")
-                print(f"     Why: {item['reason']}")
-                print(f"     Resources:")
-                for resource in item['resources'][:2]:
-                    print(f"       • {resource}")
-        else:
-            print("✅ No skill gaps! You meet all requirements.")
-        
-        # Recommendations
-        print_section("💡 TOP RECOMMENDATIONS")
-        for i, rec in enumerate(enhanced_result.recommendations, 1):
-            print(f"{i}. {rec}\n")
-        
-        # Industry Benchmark
-        print_section("📊 INDUSTRY BENCHMARK")
-        benchmark = enhanced_result.industry_benchmark
-        print(f"Your Score: {benchmark['your_score']:.1f}")
-        print(f"Average Applicant: {benchmark['average_applicant']}")
-        print(f"Top 25%: {benchmark['top_25_percent']}")
-        print(f"Top 10%: {benchmark['top_10_percent']}")
-        print(f"\n🎯 You're in the {benchmark['percentile']}th percentile")
-        print(f"\n{benchmark['interpretation']}")
-        
-        print("\n" + "=" * 80)
-        print("✅ ENHANCED ANALYSIS COMPLETE!")
-        print("=" * 80 + "\n")
-        
-    finally:
-        # Clean up temp file
-        import os
-        if os.path.exists(temp_resume_path):
-            os.remove(temp_resume_path)
+    # Parse resume and job description once; both feed the scoring and the
+    # enhanced explanation
+    resume_data = _get_resume_parser().parse_text(SAMPLE_RESUME)
+    job_data = _get_jd_parser().parse(JOB_DESCRIPTION)
+    
+    # Basic analysis (resume and job are embedded in one SBERT batch)
+    result = analyzer.analyze_many([resume_data], job_data)[0]
+    
+    # Get the score breakdown from the result object
+    score_breakdown = result.score_breakdown
+    
+    # Enhanced analysis
+    enhanced_result = enhanced_explainer.explain(
+        score_breakdown=score_breakdown,
+        resume_data=resume_data,
+        job_data=job_data,
+        resume_text=SAMPLE_RESUME
+    )
+    
+    # Display results
+    print_section("📊 OVERALL SCORE")
+    print(f"Score: {result.score:.1f}/100")
+    print(f"Confidence: {result.confidence*100:.0f}%")
+    print(f"Classification: {result.classification}")
+    print(f"\n{enhanced_result.summary}")
+    
+    # Score breakdowns
+    print_section("📈 DETAILED SCORE EXPLANATIONS")
+    for component, explanation in enhanced_result.score_explanations_list:
+        print(f"\n{component}")
+        print("-" * 80)
+        print(explanation)
+    
+    # Skill analysis
+    print_section("🎯 SKILL-BY-SKILL ANALYSIS")
+    
+    # Split the skills in one pass over the analysis
+    matched_skills, missing_skills = [], []
+    for skill in enhanced_result.skill_analysis:
+        (matched_skills if skill.is_matched else missing_skills).append(skill)
+    
+    # Each list is rendered into one string and written in a single call
+    print("✅ MATCHED SKILLS:")
+    sys.stdout.write("".join(
+        f"\n  • {skill.skill_name} ({skill.importance})\n"
+        f"    {skill.reason}\n"
+        f"    Market Demand: {skill.market_demand}\n"
+        for skill in matched_skills
+    ))
+    
+    print("\n\n❌ MISSING SKILLS:")
+    sys.stdout.write("".join(
+        f"\n  • {skill.skill_name} ({skill.importance})\n"
+        f"    {skill.reason}\n"
+        f"    Learning Time: {skill.estimated_learning_time}\n"
+        f"    Resources:\n"
+        + "".join(f"      - {resource}\n" for resource in skill.learning_resources[:2])
+        for skill in missing_skills
+    ))
+    
+    # ATS Compatibility
+    print_section("🤖 ATS COMPATIBILITY CHECK")
+    ats = enhanced_result.ats_compatibility
+    print(f"Overall ATS Score: {ats.overall_score:.1f}/100")
+    print(f"ATS Friendly: {'✅ YES' if ats.is_ats_friendly else '⚠️  NEEDS IMPROVEMENT'}")
+    print(f"Formatting Score: {ats.formatting_score:.1f}/100")
+    print(f"Keyword Optimization: {ats.keyword_optimization:.1f}/100")
+    
+    if ats.issues:
+        print("\n⚠️  Issues Found:")
+        sys.stdout.write("".join(f"  • {issue}\n" for issue in ats.issues))
+    
+    if ats.recommendations:
+        print("\n💡 Recommendations:")
+        sys.stdout.write("".join(f"  • {rec}\n" for rec in ats.recommendations))
+    
+    # Career Insights
+    print_section("💼 CAREER INSIGHTS")
+    career = enhanced_result.career_insights
+    print(f"Career Level: {career['career_level']}")
+    print(f"Role Fit: {career['role_fit']}")
+    
+    if career['growth_potential']:
+        print("\n📈 Growth Potential:")
+        sys.stdout.write("".join(f"  • {insight}\n" for insight in career['growth_potential']))
+    
+    if career['alternative_roles']:
+        print("\n🔄 Alternative Roles to Consider:")
+        sys.stdout.write("".join(f"  • {role}\n" for role in career['alternative_roles']))
+    
+    # Learning Roadmap
+    print_section("📚 PERSONALIZED LEARNING ROADMAP")
+    if enhanced_result.learning_roadmap:
+        lines = []
+        current_phase = 0
+        for item in enhanced_result.learning_roadmap:
+            if item['phase'] != current_phase:
+                current_phase = item['phase']
+                lines.append(f"\n🎯 PHASE {current_phase} ({item['priority']} Priority)")
+                lines.append("-" * 80)
+            
+            lines.append(f"\n  📖 {item['skill']}")
+            lines.append(f"     Time: {item['estimated_time']} | Demand: {item['market_demand']}")
+            lines.append(f"     Why: {item['reason']}")
+            lines.append(f"     Resources:")
+            lines.extend(f"       • {resource}" for resource in item['resources'][:2])
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        print("✅ No skill gaps! You meet all requirements.")
+    
+    # Recommendations
+    print_section("💡 TOP RECOMMENDATIONS")
+    sys.stdout.write("".join(
+        f"{i}. {rec}\n\n" for i, rec in enumerate(enhanced_result.recommendations, 1)
+    ))
+    
+    # Industry Benchmark
+    print_section("📊 INDUSTRY BENCHMARK")
+    benchmark = enhanced_result.industry_benchmark
+    print(f"Your Score: {benchmark['your_score']:.1f}")
+    print(f"Average Applicant: {benchmark['average_applicant']}")
+    print(f"Top 25%: {benchmark['top_25_percent']}")
+    print(f"Top 10%: {benchmark['top_10_percent']}")
+    print(f"\n🎯 You're in the {benchmark['percentile']}th percentile")
+    print(f"\n{benchmark['interpretation']}")
+    
+    print("\n" + "=" * 80)
+    print("✅ ENHANCED ANALYSIS COMPLETE!")
+    print("=" * 80 + "\n")
 
 if __name__ == "__main__":
     main()
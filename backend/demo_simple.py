@@ -6,9 +6,10 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-print("\n" + "="*80)
-print("ENHANCED RESUME ANALYSIS - WHAT'S NEW")
-print("="*80 + "\n")
+SEP = "=" * 80
+SUBSEP = "-" * 80
+
+print(f"\n{SEP}\nENHANCED RESUME ANALYSIS - WHAT'S NEW\n{SEP}\n")
 
 print("""
 1. DETAILED SCORE EXPLANATIONS
@@ -50,12 +51,10 @@ print("""
    - Interpretation of your competitive position
 """)
 
-print("\n" + "="*80)
-print("EXAMPLE: Job Requiring Python, C, GoLang, SQL, PostgreSQL, VoIP")
-print("="*80 + "\n")
+print(f"\n{SEP}\nEXAMPLE: Job Requiring Python, C, GoLang, SQL, PostgreSQL, VoIP\n{SEP}\n")
 
 print("SKILL ANALYSIS for 'GoLang':")
-print("-" * 80)
+print(SUBSEP)
 print("""
 Name: GoLang
 Status: MISSING
@@ -77,7 +76,7 @@ Estimated Learning Time: 2-3 months
 """)
 
 print("\nATS COMPATIBILITY:")
-print("-" * 80)
+print(SUBSEP)
 print("""
 Overall Score: 75/100  
 Status: ATS-Friendly with minor improvements needed
@@ -96,7 +95,7 @@ Recommendations:
 """)
 
 print("\nLEARNING ROADMAP:")
-print("-" * 80)
+print(SUBSEP)
 print("""
 PHASE 1 (Critical Priority - Start Now):
   1. GoLang
@@ -117,7 +116,7 @@ PHASE 2 (Important - After Phase 1):
 """)
 
 print("\nINDUSTRY BENCHMARK:")
-print("-" * 80)
+print(SUBSEP)
 print("""
 Your Score: 58.6/100
 Average Applicant: 62/100
@@ -131,9 +130,7 @@ Focus on acquiring the 2-3 critical missing skills to move into
 the top 25% and significantly improve your chances.
 """)
 
-print("\n" + "="*80)
-print("TO USE THIS IN YOUR APP:")
-print("="*80 + "\n")
+print(f"\n{SEP}\nTO USE THIS IN YOUR APP:\n{SEP}\n")
 
 print("""
 API Endpoint: POST /api/analyze-enhanced
@@ -148,5 +145,4 @@ Simply upload your resume and job description, and you'll get
 a comprehensive report that truly helps candidates improve!
 """)
 
-print("\n" + "="*80)
-print("="*80 + "\n")
+print(f"\n{SEP}\n{SEP}\n")
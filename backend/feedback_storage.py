@@ -4,7 +4,8 @@ Collects user feedback for future model improvements
 """
 
 import sqlite3
-import json
+import threading
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -12,20 +13,60 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-connection settings. WAL lets the stats/export readers run alongside
+# the batched feedback writer; NORMAL sync is durable enough under WAL.
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Record fields stored as JSON text, in column order
+JSON_FIELDS = ('matched_skills', 'missing_skills', 'score_breakdown')
+
+
+def _encode_json(value) -> Optional[str]:
+    """Encode a list/dict field for a TEXT column (empty values are stored as NULL)"""
+    return orjson.dumps(value).decode() if value else None
+
 
 class FeedbackStorage:
     """Store and retrieve user feedback on resume analyses"""
     
+    __slots__ = ('db_path', '_conn', '_lock')
+    
     def __init__(self, db_path: str = "feedback.db"):
         """Initialize feedback storage with SQLite database"""
         self.db_path = db_path
+        # One connection for the storage's lifetime, shared across threads;
+        # the lock serializes use since a connection is not thread-safe
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(CONNECTION_PRAGMAS)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
         self._init_database()
     
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _init_database(self):
         """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
+        # journal_mode is persistent, so it only needs setting once per database
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS feedback (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,8 +85,32 @@ class FeedbackStorage:
             )
         """)
         
+        # Partial indexes covering the statistics and training-export filters
+        cursor.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_rating
+                ON feedback(user_rating) WHERE user_rating IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_helpful
+                ON feedback(was_helpful) WHERE was_helpful = 1;
+            CREATE INDEX IF NOT EXISTS idx_training
+                ON feedback(user_rating)
+                WHERE resume_text IS NOT NULL
+                AND job_description IS NOT NULL
+                AND user_rating IS NOT NULL;
+        """)
+        
+        # One row per matched/missing skill, so skill queries use an index
+        # instead of decoding the JSON columns
+        cursor.executescript("""
+            CREATE TABLE IF NOT EXISTS feedback_skills (
+                session_id TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                PRIMARY KEY (session_id, skill, kind)
+            );
+            CREATE INDEX IF NOT EXISTS idx_fs_skill ON feedback_skills(skill);
+        """)
+        
         conn.commit()
-        conn.close()
         logger.info(f"Feedback database initialized at {self.db_path}")
     
     def save_feedback(
@@ -79,94 +144,119 @@ class FeedbackStorage:
         Returns:
             bool: Success status
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        saved = self.save_feedback_many([{
+            'session_id': session_id,
+            'overall_score': overall_score,
+            'user_rating': user_rating,
+            'was_helpful': was_helpful,
+            'comments': comments,
+            'resume_text': resume_text,
+            'job_description': job_description,
+            'matched_skills': matched_skills,
+            'missing_skills': missing_skills,
+            'score_breakdown': score_breakdown
+        }])
+        return saved == 1
+    
+    def save_feedback_many(self, records: List[Dict]) -> int:
+        """
+        Save several feedback entries in a single transaction
+        
+        Args:
+            records: Dictionaries with the same fields as save_feedback()
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO feedback 
-                (timestamp, overall_score, user_rating, was_helpful, comments,
-                 resume_text, job_description, matched_skills, missing_skills,
-                 score_breakdown, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now().isoformat(),
-                overall_score,
-                user_rating,
-                was_helpful,
-                comments,
-                resume_text,
-                job_description,
-                json.dumps(matched_skills) if matched_skills else None,
-                json.dumps(missing_skills) if missing_skills else None,
-                json.dumps(score_breakdown) if score_breakdown else None,
-                session_id
-            ))
+        Returns:
+            int: Number of saved entries (0 on failure)
+        """
+        if not records:
+            return 0
+        
+        try:
+            # One stamp for the whole batch, formatted once
+            timestamp = datetime.now().isoformat()
+            # Encode inside the guard, so unserializable fields fail the batch
+            rows = [
+                (
+                    timestamp,
+                    r['overall_score'],
+                    r.get('user_rating'),
+                    r.get('was_helpful'),
+                    r.get('comments'),
+                    r.get('resume_text'),
+                    r.get('job_description'),
+                    *(_encode_json(r.get(key)) for key in JSON_FIELDS),
+                    r['session_id']
+                )
+                for r in records
+            ]
+            skill_rows = [
+                (r['session_id'], skill, kind)
+                for r in records
+                for kind in ('matched', 'missing')
+                for skill in r.get(f'{kind}_skills') or ()
+            ]
             
-            conn.commit()
-            conn.close()
+            with self._lock, self._conn as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO feedback 
+                    (timestamp, overall_score, user_rating, was_helpful, comments,
+                     resume_text, job_description, matched_skills, missing_skills,
+                     score_breakdown, session_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                # Replaced sessions drop their previous skill rows
+                conn.executemany(
+                    "DELETE FROM feedback_skills WHERE session_id = ?",
+                    [(r['session_id'],) for r in records]
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO feedback_skills (session_id, skill, kind) VALUES (?, ?, ?)",
+                    skill_rows
+                )
             
-            logger.info(f"Feedback saved for session {session_id}")
-            return True
+            logger.info(f"Feedback saved for {len(rows)} sessions")
+            return len(rows)
             
         except Exception as e:
-            logger.error(f"Error saving feedback: {e}")
-            return False
+            logger.error(f"Error saving feedback batch: {e}")
+            return 0
     
     def get_all_feedback(self, limit: int = 100) -> List[Dict]:
         """Get all feedback entries"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM feedback 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        """, (limit,))
-        
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+        with self._lock:
+            return [dict(row) for row in self._conn.execute("""
+                SELECT * FROM feedback 
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """, (limit,))]
     
     def get_statistics(self) -> Dict:
         """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total count
-        cursor.execute("SELECT COUNT(*) FROM feedback")
-        total_count = cursor.fetchone()[0]
-        
-        # Average rating
-        cursor.execute("SELECT AVG(user_rating) FROM feedback WHERE user_rating IS NOT NULL")
-        avg_rating = cursor.fetchone()[0] or 0
-        
-        # Helpful percentage
-        cursor.execute("SELECT COUNT(*) FROM feedback WHERE was_helpful = 1")
-        helpful_count = cursor.fetchone()[0]
-        
-        # Score distribution
-        cursor.execute("""
-            SELECT 
-                AVG(overall_score) as avg_score,
-                MIN(overall_score) as min_score,
-                MAX(overall_score) as max_score
-            FROM feedback
-        """)
-        score_stats = cursor.fetchone()
+        # One pass over the table for all aggregates (AVG skips NULL ratings)
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT 
+                    COUNT(*),
+                    AVG(user_rating),
+                    SUM(CASE WHEN was_helpful = 1 THEN 1 ELSE 0 END),
+                    AVG(overall_score),
+                    MIN(overall_score),
+                    MAX(overall_score)
+                FROM feedback
+            """).fetchone()
         
-        conn.close()
+        total_count, avg_rating, helpful_count, avg_score, min_score, max_score = row
+        avg_rating = avg_rating or 0
+        helpful_count = helpful_count or 0
         
         return {
             "total_feedback": total_count,
             "average_rating": round(avg_rating, 2),
             "helpful_count": helpful_count,
             "helpful_percentage": round((helpful_count / total_count * 100) if total_count > 0 else 0, 2),
-            "avg_score": round(score_stats[0], 2) if score_stats[0] else 0,
-            "min_score": score_stats[1] or 0,
-            "max_score": score_stats[2] or 0
+            "avg_score": round(avg_score, 2) if avg_score else 0,
+            "min_score": min_score or 0,
+            "max_score": max_score or 0
         }
     
     def export_training_data(self, output_path: str = "training_data.json") -> int:
@@ -176,42 +266,42 @@ class FeedbackStorage:
         Returns:
             Number of exported records
         """
+        # Stream from a separate connection: under WAL it reads a consistent
+        # snapshot without holding the shared connection's lock for the export
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get entries with ratings and both texts
-        cursor.execute("""
-            SELECT resume_text, job_description, overall_score, user_rating
-            FROM feedback
-            WHERE resume_text IS NOT NULL 
-            AND job_description IS NOT NULL
-            AND user_rating IS NOT NULL
-        """)
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        # Prepare training data
-        training_data = []
-        for row in rows:
-            # Normalize rating (1-5) to score (0-1)
-            normalized_score = row[3] / 5.0
+        count = 0
+        try:
+            # Get entries with ratings and both texts
+            cursor = conn.execute("""
+                SELECT resume_text, job_description, overall_score, user_rating
+                FROM feedback
+                WHERE resume_text IS NOT NULL 
+                AND job_description IS NOT NULL
+                AND user_rating IS NOT NULL
+            """)
             
-            training_data.append({
-                "resume_text": row[0],
-                "job_text": row[1],
-                "system_score": row[2],
-                "user_score": normalized_score,
-                "final_score": (row[2] + normalized_score) / 2  # Blend both scores
-            })
-        
-        # Save to JSON
-        with open(output_path, 'w') as f:
-            json.dump(training_data, f, indent=2)
+            # Write one record at a time so memory stays flat for large tables
+            with open(output_path, 'wb') as f:
+                f.write(b'[')
+                for resume_text, job_text, system_score, user_rating in cursor:
+                    # Normalize rating (1-5) to score (0-1)
+                    normalized_score = user_rating / 5.0
+                    
+                    f.write(b',\n' if count else b'\n')
+                    f.write(orjson.dumps({
+                        "resume_text": resume_text,
+                        "job_text": job_text,
+                        "system_score": system_score,
+                        "user_score": normalized_score,
+                        "final_score": (system_score + normalized_score) / 2  # Blend both scores
+                    }))
+                    count += 1
+                f.write(b'\n]\n')
+        finally:
+            conn.close()
         
-        logger.info(f"Exported {len(training_data)} training examples to {output_path}")
-        return len(training_data)
-
+        logger.info(f"Exported {count} training examples to {output_path}")
+        return count
 
 # Singleton instance
 _feedback_storage = None
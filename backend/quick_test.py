@@ -1,16 +1,33 @@
 """Quick test - check if server is responding"""
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
 print("Testing backend server...")
 
+# One keep-alive session so every check reuses the same connection
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+def wait_for_server(delays=(0.1, 0.2, 0.5, 1.0)):
+    """Probe /health with HEAD, backing off while the server starts up"""
+    for delay in delays:
+        try:
+            return session.head("http://localhost:8000/health", timeout=0.5)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            time.sleep(delay)
+    return session.head("http://localhost:8000/health", timeout=0.5)
+
+
 try:
     # Test 1: Health check
-    response = requests.get("http://localhost:8000/health", timeout=2)
-    print(f"✓ Server is running: {response.json()}")
+    response = wait_for_server()
+    response.raise_for_status()
+    print(f"✓ Server is running (HTTP {response.status_code})")
     
     # Test 2: Skills database
-    response = requests.get("http://localhost:8000/api/skills", timeout=5)
+    response = session.get("http://localhost:8000/api/skills", timeout=5)
     data = response.json()
     print(f"\n✓ Total Skills: {data['total_skills']}")
     print(f"✓ Categories: {', '.join(list(data['categories'].keys())[:5])}...")
@@ -26,6 +43,6 @@ try:
     print("\n💡 Open http://localhost:3000 to test in the web app")
     
 except requests.exceptions.ConnectionError:
-    print("❌ Server not responding. Starting it now...")
+    print("❌ Server not responding. Start it with: python api.py")
 except Exception as e:
     print(f"❌ Error: {e}")
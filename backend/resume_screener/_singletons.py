@@ -0,0 +1,35 @@
+"""
+Shared Component Instances
+Process-wide instances of the expensive-to-build components, so scripts that
+construct them repeatedly load models only once
+"""
+
+from functools import lru_cache
+
+from .main import ResumeAnalyzer
+from .explainability.enhanced_explainer import EnhancedExplainabilityEngine
+from .parsers.document_parser import ResumeParser, JobDescriptionParser
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer() -> ResumeAnalyzer:
+    """Get or create the shared analyzer (SBERT, no spaCy)"""
+    return ResumeAnalyzer(use_sbert=True, use_spacy=False)
+
+
+@lru_cache(maxsize=1)
+def _get_enhanced_explainer() -> EnhancedExplainabilityEngine:
+    """Get or create the shared enhanced explainability engine"""
+    return EnhancedExplainabilityEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_resume_parser() -> ResumeParser:
+    """Get the shared resume parser (the analyzer's own instance)"""
+    return _get_analyzer().resume_parser
+
+
+@lru_cache(maxsize=1)
+def _get_jd_parser() -> JobDescriptionParser:
+    """Get the shared job description parser (the analyzer's own instance)"""
+    return _get_analyzer().job_parser
@@ -3,25 +3,82 @@ Bias Detection Module
 Analyzes potential bias in resume screening
 """
 
+import os
 import re
-from typing import Dict, List, Any, Set
+import multiprocessing
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 import logging
 from collections import defaultdict
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Risk thresholds on a text's total indicator count
+HIGH_RISK_ISSUES = 5
+MEDIUM_RISK_ISSUES = 2
+
+ANALYSIS_LEVELS = ('summary', 'full')
+
+# 're2' trades some speed for RE2's linear-time matching guarantee
+REGEX_BACKENDS = ('re', 're2')
+
+# Issue reported for each non-empty indicator list, in report order
+ISSUE_MESSAGES = (
+    ('gender_indicators', 'Gender indicators detected'),
+    ('age_indicators', 'Age-related information found'),
+    ('ethnicity_indicators', 'Ethnicity/race indicators present'),
+    ('protected_attributes', 'Protected attributes mentioned'),
+)
+
+# Resumes per process-pool task, large enough to amortize pickling
+BATCH_CHUNK_SIZE = 100
+
+
+# Maximal runs of word characters, i.e. the spans \b delimits
+_WORD_RE = re.compile(r'\w+')
+
+# Maps every ASCII non-word character to a space, so that for ASCII text
+# translate() + split() yields the same tokens as _WORD_RE
+_ASCII_TOKENIZE_TABLE = str.maketrans({
+    char: ' ' for char in map(chr, range(128))
+    if not (char.isalnum() or char == '_')
+})
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character counts as part of a word for \\b boundaries"""
+    return char.isalnum() or char == '_'
+
+
 class BiasDetector:
     """Detect potential bias in resume and screening process"""
     
+    # Compiled patterns live on the class; instances only pick a regex engine
+    __slots__ = ('regex_backend', '_age_regex', '_redact_regex')
+    
     # Sensitive attributes that might indicate bias
     GENDER_INDICATORS = {
-        'male': ['he', 'his', 'him', 'mr', 'gentleman', 'guy', 'brother', 'son', 'father', 'husband'],
-        'female': ['she', 'her', 'hers', 'ms', 'mrs', 'miss', 'lady', 'woman', 'sister', 'daughter', 'mother', 'wife']
+        'male': ('he', 'his', 'him', 'mr', 'gentleman', 'guy', 'brother', 'son', 'father', 'husband'),
+        'female': ('she', 'her', 'hers', 'ms', 'mrs', 'miss', 'lady', 'woman', 'sister', 'daughter', 'mother', 'wife')
     }
     
-    AGE_PATTERNS = [
+    AGE_PATTERNS = (
         r'\b(19|20)\d{2}\b',  # Birth years
         r'\b\d{2}\s*years?\s*old\b',
         r'\baged?\s*\d{2}\b',
@@ -29,43 +86,158 @@ class BiasDetector:
         r'\bsenior\b',
         r'\bjunior\b',
         r'\brecent\s+graduate\b'
-    ]
+    )
     
-    ETHNICITY_INDICATORS = [
+    ETHNICITY_INDICATORS = frozenset({
         'asian', 'caucasian', 'african', 'hispanic', 'latino', 'latina',
         'black', 'white', 'native', 'indigenous', 'minority'
-    ]
+    })
     
     # University names that might indicate geography/background
-    GEOGRAPHY_INDICATORS = [
+    GEOGRAPHY_INDICATORS = frozenset({
         'country', 'region', 'city', 'hometown', 'nationality', 'citizen'
-    ]
+    })
     
     # Other protected attributes
-    PROTECTED_ATTRIBUTES = [
+    PROTECTED_ATTRIBUTES = frozenset({
         'married', 'single', 'divorced', 'children', 'kids', 'family',
         'religion', 'religious', 'church', 'temple', 'mosque',
         'disability', 'disabled', 'veteran', 'military'
-    ]
+    })
+    
+    def __init__(self, regex_backend: str = 're'):
+        """
+        Initialize bias detector
+        
+        Args:
+            regex_backend: 're', or 're2' to run the age and redaction
+                patterns on RE2 (linear time, so no backtracking blowups on
+                untrusted corpora; falls back to 're' if not installed)
+        """
+        if regex_backend not in REGEX_BACKENDS:
+            raise ValueError(f"regex_backend must be one of {REGEX_BACKENDS}, got {regex_backend!r}")
+        
+        self._compile_patterns()
+        
+        self._age_regex = self._age_re
+        self._redact_regex = _REDACT_RE
+        if regex_backend == 're2' and re2 is None:
+            logger.warning("google-re2 not installed; using re for bias patterns")
+            regex_backend = 're'
+        if regex_backend == 're2':
+            # Flags are inline in both patterns, so RE2 reads them as is
+            self._age_regex = re2.compile(self._age_re.pattern)
+            self._redact_regex = re2.compile(_REDACT_RE.pattern)
+        self.regex_backend = regex_backend
     
-    def __init__(self):
-        """Initialize bias detector"""
-        self.bias_warnings = []
+    @classmethod
+    def _compile_patterns(cls):
+        """
+        Build the keyword table, automaton and age regex once per class
+        
+        Instances share the compiled patterns, and a subclass that overrides
+        the indicator lists gets its own on first instantiation.
+        """
+        if cls.__dict__.get('_compiled'):
+            return
+        
+        # Every gender/ethnicity/protected keyword, tagged with its category
+        # and the label reported for it, so one pass finds all of them
+        keywords: Dict[str, Tuple[str, str]] = {}
+        for gender, indicators in cls.GENDER_INDICATORS.items():
+            for indicator in indicators:
+                keywords[indicator] = ('gender', f"{indicator} ({gender})")
+        for indicator in cls.ETHNICITY_INDICATORS:
+            keywords[indicator] = ('ethnicity', indicator)
+        for attr in cls.PROTECTED_ATTRIBUTES:
+            keywords[attr] = ('protected', attr)
+        
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for word in keywords:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+        else:
+            automaton = None
+        
+        cls._keywords = keywords
+        cls._automaton = automaton
+        cls._age_re = re.compile(
+            '(?i)' + '|'.join(f'(?:{pattern})' for pattern in cls.AGE_PATTERNS)
+        )
+        cls._compiled = True
     
     def detect(self, resume_text: str, 
-              job_description: str = None) -> Dict[str, Any]:
+              job_description: str = None,
+              level: str = 'full') -> Dict[str, Any]:
         """
         Detect potential bias in resume and/or job description
         
         Args:
             resume_text: Resume text to analyze
             job_description: Optional job description to analyze
+            level: 'full' for every indicator, issue, warning and recommendation;
+                'summary' for risk levels only (indicator lists may be partial
+                once a text is already high risk, warnings and recommendations
+                are left empty)
             
         Returns:
             Dictionary with bias detection results
         """
+        if level not in ANALYSIS_LEVELS:
+            raise ValueError(f"level must be one of {ANALYSIS_LEVELS}, got {level!r}")
+        
+        # Screening UIs re-check the same texts, so results are memoized;
+        # callers get their own copy to mutate
+        return copy.deepcopy(_detect_cached(self, resume_text, job_description, level))
+    
+    def detect_batch(self, resumes: List[str],
+                     job_description: Optional[str] = None,
+                     workers: Optional[int] = None,
+                     level: str = 'full') -> List[Dict[str, Any]]:
+        """
+        Detect potential bias in many resumes against one job description
+        
+        Batches larger than one chunk are spread over a process pool, since
+        the scans are pure Python and don't scale across threads.
+        
+        Args:
+            resumes: Resume texts to analyze
+            job_description: Optional job description to analyze with each
+            workers: Number of worker processes (defaults to CPU count)
+            level: 'full' or 'summary', as for detect()
+            
+        Returns:
+            Bias detection results, in the same order as resumes
+        """
+        if level not in ANALYSIS_LEVELS:
+            raise ValueError(f"level must be one of {ANALYSIS_LEVELS}, got {level!r}")
+        
+        chunks = [
+            resumes[i:i + BATCH_CHUNK_SIZE]
+            for i in range(0, len(resumes), BATCH_CHUNK_SIZE)
+        ]
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        if workers <= 1:
+            return [self._detect(text, job_description, level) for text in resumes]
+        
+        # Spawned, not forked: the caller may already have started threads
+        # (torch, the API server), which a forked child can't use safely
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_detect_worker,
+                                 initargs=(type(self), self.regex_backend)) as pool:
+            results = pool.map(
+                _detect_chunk, chunks,
+                [job_description] * len(chunks), [level] * len(chunks)
+            )
+            return [result for chunk_results in results for result in chunk_results]
+    
+    def _detect(self, resume_text: str, job_description: str,
+                level: str) -> Dict[str, Any]:
+        """Uncached detect()"""
         results = {
-            'resume_bias': self._analyze_text(resume_text, 'resume'),
+            'resume_bias': self._analyze_text(resume_text, 'resume', level),
             'job_bias': None,
             'overall_risk': 'low',
             'warnings': [],
@@ -73,7 +245,7 @@ class BiasDetector:
         }
         
         if job_description:
-            results['job_bias'] = self._analyze_text(job_description, 'job_description')
+            results['job_bias'] = self._analyze_text(job_description, 'job_description', level)
         
         # Calculate overall risk
         resume_risk = results['resume_bias']['risk_level']
@@ -85,20 +257,24 @@ class BiasDetector:
             results['overall_risk'] = 'medium'
         
         # Generate warnings and recommendations
-        results['warnings'] = self._generate_warnings(results)
-        results['recommendations'] = self._generate_recommendations(results)
+        if level == 'full':
+            results['warnings'] = self._generate_warnings(results)
+            results['recommendations'] = self._generate_recommendations(results)
         
         return results
     
-    def _analyze_text(self, text: str, text_type: str) -> Dict[str, Any]:
+    def _analyze_text(self, text: str, text_type: str,
+                      level: str = 'full') -> Dict[str, Any]:
         """Analyze text for bias indicators"""
-        text_lower = text.lower()
+        # The keyword automaton is case-sensitive and needs a lowercased copy;
+        # the age regex ignores case and scans the original text
+        keyword_hits = self._detect_keywords(text.lower())
         
         findings = {
-            'gender_indicators': self._detect_gender(text_lower),
-            'age_indicators': self._detect_age(text_lower),
-            'ethnicity_indicators': self._detect_ethnicity(text_lower),
-            'protected_attributes': self._detect_protected_attributes(text_lower),
+            'gender_indicators': keyword_hits['gender'],
+            'age_indicators': [],
+            'ethnicity_indicators': keyword_hits['ethnicity'],
+            'protected_attributes': keyword_hits['protected'],
             'risk_level': 'low',
             'issues_found': []
         }
@@ -106,64 +282,78 @@ class BiasDetector:
         # Count total issues
         total_issues = (
             len(findings['gender_indicators']) +
-            len(findings['age_indicators']) +
             len(findings['ethnicity_indicators']) +
             len(findings['protected_attributes'])
         )
         
+        # A summary stops once the keywords alone make the text high risk
+        if level == 'full' or total_issues < HIGH_RISK_ISSUES:
+            findings['age_indicators'] = self._detect_age(text)
+            total_issues += len(findings['age_indicators'])
+        
         # Determine risk level
-        if total_issues >= 5:
+        if total_issues >= HIGH_RISK_ISSUES:
             findings['risk_level'] = 'high'
-        elif total_issues >= 2:
+        elif total_issues >= MEDIUM_RISK_ISSUES:
             findings['risk_level'] = 'medium'
         else:
             findings['risk_level'] = 'low'
         
+        if level == 'summary':
+            return findings
+        
         # List specific issues
-        if findings['gender_indicators']:
-            findings['issues_found'].append('Gender indicators detected')
-        if findings['age_indicators']:
-            findings['issues_found'].append('Age-related information found')
-        if findings['ethnicity_indicators']:
-            findings['issues_found'].append('Ethnicity/race indicators present')
-        if findings['protected_attributes']:
-            findings['issues_found'].append('Protected attributes mentioned')
+        findings['issues_found'] = [
+            issue for field, issue in ISSUE_MESSAGES if findings[field]
+        ]
         
         return findings
     
-    def _detect_gender(self, text: str) -> List[str]:
-        """Detect gender indicators"""
-        found = []
-        for gender, indicators in self.GENDER_INDICATORS.items():
-            for indicator in indicators:
-                if re.search(rf'\b{indicator}\b', text):
-                    found.append(f"{indicator} ({gender})")
-        return list(set(found))
-    
-    def _detect_age(self, text: str) -> List[str]:
-        """Detect age indicators"""
-        found = []
-        for pattern in self.AGE_PATTERNS:
-            matches = re.findall(pattern, text)
-            if matches:
-                found.extend(matches)
+    def _detect_keywords(self, text: str) -> Dict[str, List[str]]:
+        """
+        Detect gender, ethnicity and protected-attribute keywords in one pass
+        
+        Args:
+            text: Lowercased text
+            
+        Returns:
+            Dictionary mapping 'gender', 'ethnicity' and 'protected' to the
+            distinct labels found, in order of first occurrence
+            (whole-word matches only)
+        """
+        # Ordered dicts dedupe as the scan goes and keep first-seen order,
+        # so reports are reproducible
+        keywords = self._keywords
+        if text.isascii():
+            # Most resumes are plain ASCII, where translate() runs a tight
+            # table lookup and beats both the automaton and the regex
+            words = dict.fromkeys(
+                token for token in text.translate(_ASCII_TOKENIZE_TABLE).split()
+                if token in keywords
+            )
+        elif self._automaton is not None:
+            words = {}
+            for end, word in self._automaton.iter(text):
+                start = end - len(word) + 1
+                if (start == 0 or not _is_word_char(text[start - 1])) and \
+                        (end + 1 == len(text) or not _is_word_char(text[end + 1])):
+                    words[word] = None
+        else:
+            # Keywords are single words, so whole-word matches are exactly
+            # the \w+ tokens that appear in the keyword table
+            words = dict.fromkeys(
+                token for token in _WORD_RE.findall(text) if token in keywords
+            )
+        
+        found = {'gender': [], 'ethnicity': [], 'protected': []}
+        for word in words:
+            category, label = keywords[word]
+            found[category].append(label)
         return found
     
-    def _detect_ethnicity(self, text: str) -> List[str]:
-        """Detect ethnicity/race indicators"""
-        found = []
-        for indicator in self.ETHNICITY_INDICATORS:
-            if re.search(rf'\b{indicator}\b', text):
-                found.append(indicator)
-        return list(set(found))
-    
-    def _detect_protected_attributes(self, text: str) -> List[str]:
-        """Detect other protected attributes"""
-        found = []
-        for attr in self.PROTECTED_ATTRIBUTES:
-            if re.search(rf'\b{attr}\b', text):
-                found.append(attr)
-        return list(set(found))
+    def _detect_age(self, text: str) -> List[str]:
+        """Detect age indicators (every occurrence, in text order, lowercased)"""
+        return [match.group().lower() for match in self._age_regex.finditer(text)]
     
     def _generate_warnings(self, results: Dict[str, Any]) -> List[str]:
         """Generate bias warnings"""
@@ -237,96 +427,139 @@ class BiasDetector:
         Returns:
             Anonymized resume text
         """
-        anonymized = resume_text
-        
-        # Remove names (simple heuristic - first capitalized word on first line)
-        lines = anonymized.split('\n')
-        if lines:
-            lines[0] = '[NAME REDACTED]'
-        
-        # Remove email addresses
-        anonymized = re.sub(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            '[EMAIL REDACTED]',
-            anonymized
-        )
-        
-        # Remove phone numbers
-        anonymized = re.sub(
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',
-            '[PHONE REDACTED]',
-            anonymized
-        )
-        
-        # Remove addresses (simple heuristic)
-        anonymized = re.sub(
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)\b',
-            '[ADDRESS REDACTED]',
-            anonymized,
-            flags=re.IGNORECASE
-        )
-        
-        # Remove gender pronouns
-        gender_replacements = {
-            r'\bhe\b': 'they',
-            r'\bhis\b': 'their',
-            r'\bhim\b': 'them',
-            r'\bshe\b': 'they',
-            r'\bher\b': 'their',
-            r'\bhers\b': 'theirs'
-        }
-        for pattern, replacement in gender_replacements.items():
-            anonymized = re.sub(pattern, replacement, anonymized, flags=re.IGNORECASE)
-        
-        # Remove age indicators
-        anonymized = re.sub(
-            r'\b(19|20)\d{2}\b',
-            '[YEAR REDACTED]',
-            anonymized
-        )
+        # Remove the name (simple heuristic - the whole first line), emails,
+        # phone numbers, addresses, gender pronouns and years in a single
+        # scan; earlier alternatives win where patterns overlap
+        anonymized = self._redact_regex.sub(_redaction, resume_text)
         
-        return '\n'.join(lines)
+        return anonymized
+
+
+# Redaction patterns, compiled once at import
+_REDACT_RE = re.compile(
+    r'(?P<name>\A[^\n]*)'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b)'
+    r'|(?P<address>(?i:\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)\b))'
+    r'|(?P<pronoun>(?i:\b(?:he|his|him|she|her|hers)\b))'
+    r'|(?P<year>\b(?:19|20)\d{2}\b)'
+)
+_REDACTIONS = {
+    'name': '[NAME REDACTED]',
+    'email': '[EMAIL REDACTED]',
+    'phone': '[PHONE REDACTED]',
+    'address': '[ADDRESS REDACTED]',
+    'year': '[YEAR REDACTED]'
+}
+_PRONOUN_REPLACEMENTS = {
+    'he': 'they',
+    'his': 'their',
+    'him': 'them',
+    'she': 'they',
+    'her': 'their',
+    'hers': 'theirs'
+}
+
+
+def _redaction(match: re.Match) -> str:
+    """Replacement text for a _REDACT_RE match"""
+    if match.lastgroup == 'pronoun':
+        return _PRONOUN_REPLACEMENTS[match.group().lower()]
+    return _REDACTIONS[match.lastgroup]
+
+@lru_cache(maxsize=256)
+def _detect_cached(detector: BiasDetector, resume_text: str,
+                   job_description: str, level: str) -> Dict[str, Any]:
+    """Memoized BiasDetector.detect; the result is shared, so don't mutate it"""
+    return detector._detect(resume_text, job_description, level)
+
+
+# Per-process detector, built once by the detect_batch pool initializer
+_worker_detector = None
+
+
+def _init_detect_worker(detector_class: type, regex_backend: str):
+    """Build the detector (and its keyword automaton) once per worker process"""
+    global _worker_detector
+    # The caller's class, so subclass indicator tables apply in workers too
+    _worker_detector = detector_class(regex_backend)
+
+
+def _detect_chunk(resumes: List[str], job_description: Optional[str],
+                  level: str) -> List[Dict[str, Any]]:
+    """Run uncached detection over a chunk of resumes (runs inside a worker)"""
+    return [_worker_detector._detect(text, job_description, level) for text in resumes]
 
 
 class FairnessMetrics:
     """Calculate fairness metrics for screening results"""
     
     @staticmethod
-    def calculate_selection_rate(results: List[Dict[str, Any]], 
+    def scores_array(results: Union[List[Dict[str, Any]], np.ndarray]) -> np.ndarray:
+        """
+        Collect result scores into a float64 array
+        
+        Args:
+            results: List of analysis results, or an array of scores
+                (returned unchanged)
+            
+        Returns:
+            1-D array of scores (missing scores count as 0)
+        """
+        if isinstance(results, np.ndarray):
+            return results
+        return np.fromiter(
+            (r.get('score', 0.0) for r in results),
+            dtype=np.float64,
+            count=len(results)
+        )
+    
+    @staticmethod
+    def calculate_selection_rate(results: Union[List[Dict[str, Any]], np.ndarray], 
                                  threshold: float = 70) -> float:
         """
         Calculate selection rate (percentage passing threshold)
         
         Args:
-            results: List of analysis results
+            results: List of analysis results, or an array of scores
+                from scores_array()
             threshold: Score threshold for selection
             
         Returns:
             Selection rate (0-1)
         """
-        if not results:
+        scores = FairnessMetrics.scores_array(results)
+        if scores.size == 0:
             return 0.0
         
-        selected = sum(1 for r in results if r.get('score', 0) >= threshold)
-        return selected / len(results)
+        return float(np.count_nonzero(scores >= threshold)) / scores.size
     
     @staticmethod
-    def calculate_adverse_impact(group1_results: List[Dict[str, Any]],
-                                group2_results: List[Dict[str, Any]],
+    def calculate_adverse_impact(group1_results: Union[List[Dict[str, Any]], np.ndarray],
+                                group2_results: Union[List[Dict[str, Any]], np.ndarray],
                                 threshold: float = 70) -> Dict[str, float]:
         """
         Calculate adverse impact ratio (80% rule)
         
         Args:
-            group1_results: Results for group 1
-            group2_results: Results for group 2
+            group1_results: Results (or score array) for group 1
+            group2_results: Results (or score array) for group 2
             threshold: Score threshold
             
         Returns:
             Dictionary with fairness metrics
         """
-        rate1 = FairnessMetrics.calculate_selection_rate(group1_results, threshold)
-        rate2 = FairnessMetrics.calculate_selection_rate(group2_results, threshold)
+        scores1 = FairnessMetrics.scores_array(group1_results)
+        scores2 = FairnessMetrics.scores_array(group2_results)
+        
+        # Both groups in one array tagged with a group id, so a single
+        # comparison and two bincounts give both selection rates
+        scores = np.concatenate((scores1, scores2))
+        groups = np.repeat((0, 1), (scores1.size, scores2.size))
+        counts = np.bincount(groups, minlength=2)
+        passes = np.bincount(groups, weights=scores >= threshold, minlength=2)
+        rates = np.divide(passes, counts, out=np.zeros(2), where=counts > 0)
+        rate1, rate2 = float(rates[0]), float(rates[1])
         
         # Adverse impact ratio (should be >= 0.8)
         if rate2 > 0:
@@ -3,18 +3,184 @@ Enhanced Explainability Module with Detailed Analysis
 Provides skill importance, ATS compatibility, learning resources, and industry benchmarking
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+import hashlib
 import re
+import threading
 import logging
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from ..scoring.scoring_engine import ScoreBreakdown
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Contact details the ATS check looks for
+_EMAIL_RE = re.compile(r'[^\s@]+@[^\s@]+\.[^\s@]+')
+_PHONE_RE = re.compile(r'\d{3}[-.]?\d{3}[-.]?\d{4}')
+
+# Section headers ATS parsers expect, and characters they often mangle
+STANDARD_SECTIONS = ('experience', 'education', 'skills')
+ATS_SPECIAL_CHARS = ('§', '©', '®', '™', '•')
+
+
+# Score component explanations: what each component measures, and its
+# verdicts from worst to best, picked by where the score falls among the
+# thresholds
+SEMANTIC_MEASURES = (
+    "**What this measures:** How well the overall content and context of the resume "
+    "matches the job description using AI language understanding. This goes beyond "
+    "keyword matching to understand meaning and relevance.\n\n"
+    "**What it means:** "
+)
+SEMANTIC_THRESHOLDS = (60, 80)
+SEMANTIC_VERDICTS = (
+    "Limited alignment. The resume content differs significantly from job requirements. "
+    "Consider rephrasing experience to better match the role's language and focus areas.",
+    "Good alignment. The resume addresses most requirements with relevant experience, "
+    "though some areas could be better articulated using job description terminology.",
+    "Excellent alignment! The resume demonstrates experience and language that "
+    "closely matches what the employer is looking for. The candidate speaks the "
+    "same 'language' as the job requirements."
+)
+
+SKILL_MATCH_MEASURES = (
+    "**What this measures:** Percentage of required technical and soft skills present "
+    "in the resume.\n\n"
+    "**What it means:** "
+)
+SKILL_MATCH_THRESHOLDS = (50, 80)
+SKILL_MATCH_VERDICTS = (
+    "Weak match. Only {matched} of {total} required skills found. "
+    "Significant skill gaps exist for this particular role.",
+    "Partial match. {matched} of {total} skills found. "
+    "Missing {missing} key skills that should be "
+    "developed or added to resume if possessed.",
+    "Excellent! {matched} of {total} required skills matched. "
+    "This candidate has most of the technical capabilities needed for this role."
+)
+
+EXPERIENCE_MEASURES = (
+    "**What this measures:** Years of relevant professional experience and career progression.\n\n"
+    "**What it means:** "
+)
+EXPERIENCE_THRESHOLDS = (50, 80)
+EXPERIENCE_VERDICTS = (
+    "Limited experience for this role. The position may require more years or "
+    "more senior-level experience than currently demonstrated.",
+    "Moderate experience. The candidate may have slightly less experience than ideal, "
+    "but could still be viable depending on skill strength.",
+    "Strong experience match! The candidate has the required years of experience "
+    "and demonstrates career growth."
+)
+
+EDUCATION_MEASURES = (
+    "**What this measures:** Educational background alignment with job requirements.\n\n"
+    "**What it means:** "
+)
+EDUCATION_THRESHOLDS = (30, 80)
+EDUCATION_VERDICTS = (
+    "Education section unclear or missing. If you have relevant education, "
+    "ensure it's prominently listed.",
+    "Education information present but may not perfectly match requirements. "
+    "Experience can often compensate for educational differences.",
+    "Education requirements met. The candidate has the appropriate educational background."
+)
+
+KEYWORD_MEASURES = (
+    "**What this measures:** Presence of exact keywords from job description (important for ATS systems).\n\n"
+    "**What it means:** "
+)
+KEYWORD_THRESHOLDS = (40, 70)
+KEYWORD_VERDICTS = (
+    "Low keyword match. Resume may struggle with automated screening systems. "
+    "Add more specific keywords from the job posting.",
+    "Moderate keyword usage. Consider incorporating more exact phrases from the "
+    "job description to improve ATS compatibility.",
+    "Good keyword optimization. Resume uses terminology from the job description "
+    "that will help it pass automated screening systems (ATS)."
+)
+
+# Overall assessment (quality, action) by score, from worst to best
+SUMMARY_THRESHOLDS = (50, 60, 70, 85)
+SUMMARY_LEVELS = (
+    ("weak", "This candidate does not meet the minimum requirements for this role."),
+    ("fair", "This candidate has some relevant experience but significant gaps exist."),
+    ("moderate", "This candidate may be suitable depending on team needs and other applicants."),
+    ("strong", "This candidate is well-qualified and recommended for interview."),
+    ("exceptional", "This candidate should be prioritized for immediate interview.")
+)
+
+# Approximate applicant percentile by overall score, from worst to best
+PERCENTILE_THRESHOLDS = (45, 55, 65, 75, 85)
+PERCENTILES = (10, 25, 40, 60, 80, 95)
+# What each percentile band means for the applicant, parallel to PERCENTILES
+BENCHMARK_INTERPRETATIONS = (
+    "Significant gaps exist. Consider additional training or different roles.",
+    "You're below average. Focus on skill development to improve.",
+    "You're below average. Focus on skill development to improve.",
+    "You're around the average applicant for this role.",
+    "You're above average and competitive for this position.",
+    "You're in the top 10% of applicants for this role!"
+)
+# Simulated benchmark data (in production, this would come from real data)
+INDUSTRY_BENCHMARK = {
+    'average_applicant': 62,
+    'top_10_percent': 82,
+    'top_25_percent': 74
+}
+_PERCENTILE_THRESHOLDS_NP = np.array(PERCENTILE_THRESHOLDS, dtype=np.float64)
+_PERCENTILES_NP = np.array(PERCENTILES, dtype=np.int64)
+
+# Keyword count from which one automaton pass beats per-keyword scans
+MIN_AUTOMATON_KEYWORDS = 12
+
+
+@lru_cache(maxsize=64)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """Build (and cache per job) an Aho-Corasick automaton over non-empty keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
 
-@dataclass
+
+def _keywords_in_text(keywords: Tuple[str, ...], text: str) -> Set[str]:
+    """
+    Find which keywords occur in text as substrings
+    
+    Args:
+        keywords: Lowercased keywords
+        text: Lowercased text
+        
+    Returns:
+        Set of the keywords found
+    """
+    # Short lists are faster as C-level substring tests: the automaton pays
+    # a Python-level step for every hit, and one-letter skills hit often
+    if ahocorasick is None or len(keywords) < MIN_AUTOMATON_KEYWORDS or not any(keywords):
+        return {keyword for keyword in keywords if keyword in text}
+    
+    # One pass over the text for all keywords, instead of one scan per keyword
+    found = {keyword for _, keyword in _keyword_automaton(keywords).iter(text)}
+    if '' in keywords:
+        found.add('')
+    return found
+
+
+@dataclass(frozen=True)
 class SkillAnalysis:
     """Detailed analysis for a specific skill"""
     skill_name: str
@@ -22,188 +188,247 @@ class SkillAnalysis:
     importance: str  # "Critical", "Important", "Beneficial"
     reason: str
     market_demand: str  # "High demand", "Growing", "Stable", "Declining"
-    learning_resources: List[str] = field(default_factory=list)
+    learning_resources: Tuple[str, ...] = ()
     estimated_learning_time: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ATSCompatibility:
     """ATS (Applicant Tracking System) compatibility analysis"""
     overall_score: float  # 0-100
     is_ats_friendly: bool
-    issues: List[str] = field(default_factory=list)
-    recommendations: List[str] = field(default_factory=list)
+    issues: Tuple[str, ...] = ()
+    recommendations: Tuple[str, ...] = ()
     formatting_score: float = 0.0
     keyword_optimization: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnhancedExplanation:
-    """Comprehensive explanation with detailed insights"""
+    """
+    Comprehensive explanation with detailed insights
+    
+    Frozen at the top level only; the dict fields stay mutable, so they are
+    left out of the hash and explain() hands each caller its own copies.
+    """
     summary: str
-    score_explanations: Dict[str, str]
-    skill_analysis: List[SkillAnalysis]
+    score_explanations: Dict[str, str] = field(hash=False)
+    skill_analysis: Tuple[SkillAnalysis, ...]
     ats_compatibility: ATSCompatibility
-    career_insights: Dict[str, Any]
-    recommendations: List[str]
-    learning_roadmap: List[Dict[str, Any]]
-    industry_benchmark: Dict[str, Any]
+    career_insights: Dict[str, Any] = field(hash=False)
+    recommendations: Tuple[str, ...]
+    learning_roadmap: Tuple[Dict[str, Any], ...] = field(hash=False)
+    industry_benchmark: Dict[str, Any] = field(hash=False)
+    # (component, explanation) pairs in display order, built once in explain()
+    score_explanations_list: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class JobExplainContext:
+    """Job data computed once and reused across resumes"""
+    job_data: Dict[str, Any] = field(hash=False)
+    skills: Tuple[str, ...]
+    # Lowercased skills for the ATS keyword check
+    keywords: Tuple[str, ...]
+    # Skills as they enter the explanation cache key
+    cache_key: bytes
+
+
+def _copy_explanation(explanation: EnhancedExplanation) -> EnhancedExplanation:
+    """Copy an explanation's dict fields (and the lists inside them)"""
+    return replace(
+        explanation,
+        score_explanations=dict(explanation.score_explanations),
+        career_insights={
+            key: list(value) if isinstance(value, list) else value
+            for key, value in explanation.career_insights.items()
+        },
+        learning_roadmap=tuple(dict(entry) for entry in explanation.learning_roadmap),
+        industry_benchmark=dict(explanation.industry_benchmark)
+    )
+
+
+# Skill importance database based on common job requirements
+SKILL_IMPORTANCE = {
+    # Programming Languages
+    'python': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'java': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'javascript': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
+    'typescript': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
+    'c': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '4-8 months'},
+    'c++': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '4-8 months'},
+    'golang': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
+    'go': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
+    'rust': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '4-6 months'},
+    'ruby': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    'php': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    'swift': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '3-4 months'},
+    'kotlin': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
+    
+    # Databases
+    'sql': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
+    'postgresql': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    'mysql': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    'mongodb': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
+    'redis': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1 month'},
+    'oracle': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    
+    # Cloud & DevOps
+    'aws': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'azure': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'gcp': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '3-6 months'},
+    'docker': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    'kubernetes': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
+    'terraform': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
+    'jenkins': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1 month'},
+    'ci/cd': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    
+    # Web & Frameworks
+    'react': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
+    'angular': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    'vue': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
+    'node.js': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
+    'django': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    'flask': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1-2 months'},
+    'spring': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
+    'express': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    
+    # Data & AI
+    'machine learning': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '6-12 months'},
+    'deep learning': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '6-12 months'},
+    'tensorflow': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'pytorch': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'data analysis': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'pandas': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    'numpy': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
+    
+    # Specialized
+    'voip': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '3-6 months'},
+    'sip': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '2-3 months'},
+    'rtp': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1-2 months'},
+    'webrtc': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
+    
+    # Soft Skills
+    'leadership': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '6-12 months'},
+    'mentoring': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
+    'communication': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': 'Ongoing'},
+    'problem solving': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': 'Ongoing'},
+}
+
+# Learning resources database
+LEARNING_RESOURCES = {
+    'python': (
+        'Python.org Official Tutorial (Free)',
+        'Real Python (realPython.com)',
+        'Python for Everybody (Coursera - Free)',
+        'Automate the Boring Stuff (Free eBook)'
+    ),
+    'golang': (
+        'Tour of Go (tour.golang.org - Free)',
+        'Go by Example (gobyexample.com - Free)',
+        'Effective Go (golang.org/doc/effective_go - Free)',
+        'Go Web Development (Udemy)'
+    ),
+    'go': (
+        'Tour of Go (tour.golang.org - Free)',
+        'Go by Example (gobyexample.com - Free)',
+        'Effective Go (golang.org/doc/effective_go - Free)'
+    ),
+    'c': (
+        'C Programming Language (Book by K&R)',
+        'CS50 Introduction to Computer Science (edX - Free)',
+        'Learn-C.org (Interactive - Free)',
+        'The C Programming Language (Coursera)'
+    ),
+    'sql': (
+        'SQLBolt (sqlbolt.com - Free)',
+        'Mode SQL Tutorial (mode.com/sql-tutorial - Free)',
+        'W3Schools SQL (Free)',
+        'SQL for Data Science (Coursera)'
+    ),
+    'postgresql': (
+        'PostgreSQL Documentation (Free)',
+        'PostgreSQL Tutorial (postgresqltutorial.com - Free)',
+        'The Art of PostgreSQL (Book)',
+        'Database Design and PostgreSQL (Udemy)'
+    ),
+    'voip': (
+        'VoIP Fundamentals (Cisco - Free)',
+        'SIP School (sipschool.com - Free)',
+        'VoIP Technologies (LinkedIn Learning)',
+        'Kamailio Documentation (Free)'
+    ),
+    'sip': (
+        'SIP: Understanding the Session Initiation Protocol (Book)',
+        'SIP School (sipschool.com - Free)',
+        'RFC 3261 - SIP Specification (Free)',
+        'Practical SIP (Udemy)'
+    ),
+    'docker': (
+        'Docker Get Started (docs.docker.com - Free)',
+        'Docker Deep Dive (Book)',
+        'Docker Mastery (Udemy)',
+        'Play with Docker (labs.play-with-docker.com - Free)'
+    ),
+    'kubernetes': (
+        'Kubernetes Documentation (Free)',
+        'Kubernetes Basics (kubernetes.io/docs - Free)',
+        'Certified Kubernetes Administrator (CNCF)',
+        'Kubernetes the Hard Way (GitHub - Free)'
+    ),
+    'aws': (
+        'AWS Training and Certification (Free tier)',
+        'AWS Certified Solutions Architect (Official)',
+        'A Cloud Guru (Subscription)',
+        'AWS Documentation (Free)'
+    ),
+    'react': (
+        'React Documentation (react.dev - Free)',
+        'React for Beginners (Free)',
+        'Full Stack Open (fullstackopen.com - Free)',
+        'Epic React (epicreact.dev)'
+    ),
+    'machine learning': (
+        'Machine Learning by Andrew Ng (Coursera)',
+        'fast.ai Practical Deep Learning (Free)',
+        'Hands-On Machine Learning (Book)',
+        'Google Machine Learning Crash Course (Free)'
+    ),
+}
+
+# (importance, demand, learning_time) for skills missing from SKILL_IMPORTANCE
+DEFAULT_SKILL_INFO = ('Important', 'Stable', 'Varies')
+
+# Resources for skills missing from LEARNING_RESOURCES, filled with the skill
+DEFAULT_LEARNING_RESOURCES = (
+    'Search for "{0} tutorial" on YouTube or Udemy',
+    'Check {0} documentation',
+    'FreeCodeCamp or Codecademy for {0}'
+)
 
 
 class EnhancedExplainabilityEngine:
     """Advanced explainability with detailed skill analysis and ATS checking"""
     
-    # Skill importance database based on common job requirements
-    SKILL_IMPORTANCE = {
-        # Programming Languages
-        'python': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'java': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'javascript': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
-        'typescript': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
-        'c': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '4-8 months'},
-        'c++': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '4-8 months'},
-        'golang': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
-        'go': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
-        'rust': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '4-6 months'},
-        'ruby': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        'php': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        'swift': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '3-4 months'},
-        'kotlin': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
-        
-        # Databases
-        'sql': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
-        'postgresql': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        'mysql': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        'mongodb': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
-        'redis': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1 month'},
-        'oracle': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        
-        # Cloud & DevOps
-        'aws': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'azure': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'gcp': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '3-6 months'},
-        'docker': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        'kubernetes': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
-        'terraform': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
-        'jenkins': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1 month'},
-        'ci/cd': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        
-        # Web & Frameworks
-        'react': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
-        'angular': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        'vue': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '1-2 months'},
-        'node.js': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-3 months'},
-        'django': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        'flask': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1-2 months'},
-        'spring': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '2-4 months'},
-        'express': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        
-        # Data & AI
-        'machine learning': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '6-12 months'},
-        'deep learning': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '6-12 months'},
-        'tensorflow': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'pytorch': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'data analysis': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'pandas': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        'numpy': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '1-2 months'},
-        
-        # Specialized
-        'voip': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '3-6 months'},
-        'sip': {'importance': 'Critical', 'demand': 'Stable', 'learning_time': '2-3 months'},
-        'rtp': {'importance': 'Important', 'demand': 'Stable', 'learning_time': '1-2 months'},
-        'webrtc': {'importance': 'Important', 'demand': 'Growing', 'learning_time': '2-3 months'},
-        
-        # Soft Skills
-        'leadership': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '6-12 months'},
-        'mentoring': {'importance': 'Important', 'demand': 'High demand', 'learning_time': '3-6 months'},
-        'communication': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': 'Ongoing'},
-        'problem solving': {'importance': 'Critical', 'demand': 'High demand', 'learning_time': 'Ongoing'},
-    }
+    # Also exposed on the class, so subclasses can override the tables
+    SKILL_IMPORTANCE = SKILL_IMPORTANCE
+    LEARNING_RESOURCES = LEARNING_RESOURCES
     
-    # Learning resources database
-    LEARNING_RESOURCES = {
-        'python': [
-            'Python.org Official Tutorial (Free)',
-            'Real Python (realPython.com)',
-            'Python for Everybody (Coursera - Free)',
-            'Automate the Boring Stuff (Free eBook)'
-        ],
-        'golang': [
-            'Tour of Go (tour.golang.org - Free)',
-            'Go by Example (gobyexample.com - Free)',
-            'Effective Go (golang.org/doc/effective_go - Free)',
-            'Go Web Development (Udemy)'
-        ],
-        'go': [
-            'Tour of Go (tour.golang.org - Free)',
-            'Go by Example (gobyexample.com - Free)',
-            'Effective Go (golang.org/doc/effective_go - Free)'
-        ],
-        'c': [
-            'C Programming Language (Book by K&R)',
-            'CS50 Introduction to Computer Science (edX - Free)',
-            'Learn-C.org (Interactive - Free)',
-            'The C Programming Language (Coursera)'
-        ],
-        'sql': [
-            'SQLBolt (sqlbolt.com - Free)',
-            'Mode SQL Tutorial (mode.com/sql-tutorial - Free)',
-            'W3Schools SQL (Free)',
-            'SQL for Data Science (Coursera)'
-        ],
-        'postgresql': [
-            'PostgreSQL Documentation (Free)',
-            'PostgreSQL Tutorial (postgresqltutorial.com - Free)',
-            'The Art of PostgreSQL (Book)',
-            'Database Design and PostgreSQL (Udemy)'
-        ],
-        'voip': [
-            'VoIP Fundamentals (Cisco - Free)',
-            'SIP School (sipschool.com - Free)',
-            'VoIP Technologies (LinkedIn Learning)',
-            'Kamailio Documentation (Free)'
-        ],
-        'sip': [
-            'SIP: Understanding the Session Initiation Protocol (Book)',
-            'SIP School (sipschool.com - Free)',
-            'RFC 3261 - SIP Specification (Free)',
-            'Practical SIP (Udemy)'
-        ],
-        'docker': [
-            'Docker Get Started (docs.docker.com - Free)',
-            'Docker Deep Dive (Book)',
-            'Docker Mastery (Udemy)',
-            'Play with Docker (labs.play-with-docker.com - Free)'
-        ],
-        'kubernetes': [
-            'Kubernetes Documentation (Free)',
-            'Kubernetes Basics (kubernetes.io/docs - Free)',
-            'Certified Kubernetes Administrator (CNCF)',
-            'Kubernetes the Hard Way (GitHub - Free)'
-        ],
-        'aws': [
-            'AWS Training and Certification (Free tier)',
-            'AWS Certified Solutions Architect (Official)',
-            'A Cloud Guru (Subscription)',
-            'AWS Documentation (Free)'
-        ],
-        'react': [
-            'React Documentation (react.dev - Free)',
-            'React for Beginners (Free)',
-            'Full Stack Open (fullstackopen.com - Free)',
-            'Epic React (epicreact.dev)'
-        ],
-        'machine learning': [
-            'Machine Learning by Andrew Ng (Coursera)',
-            'fast.ai Practical Deep Learning (Free)',
-            'Hands-On Machine Learning (Book)',
-            'Google Machine Learning Crash Course (Free)'
-        ],
-    }
+    # Explanations are memoized: UIs re-fetch and re-rank the same
+    # (resume, job, score) triples
+    CACHE_SIZE = 256
     
     def __init__(self):
         """Initialize enhanced explainability engine"""
-        pass
+        self._cache: "OrderedDict[bytes, EnhancedExplanation]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # SKILL_IMPORTANCE flattened to (importance, demand, learning_time),
+        # so each skill costs one lookup and a tuple unpack
+        self._skill_info = {
+            skill: (info['importance'], info['demand'], info['learning_time'])
+            for skill, info in self.SKILL_IMPORTANCE.items()
+        }
     
     def explain(self, 
                 score_breakdown: ScoreBreakdown,
@@ -222,6 +447,90 @@ class EnhancedExplainabilityEngine:
         Returns:
             EnhancedExplanation object
         """
+        return self._explain_cached(
+            score_breakdown, resume_data, self.precompute_job(job_data), resume_text
+        )
+    
+    def precompute_job(self, job_data: Dict[str, Any]) -> JobExplainContext:
+        """
+        Compute the job-dependent parts of an explanation once
+        
+        Args:
+            job_data: Parsed job data
+            
+        Returns:
+            JobExplainContext for explain_batch()
+        """
+        skills = tuple(job_data.get('skills', []))
+        return JobExplainContext(
+            job_data=job_data,
+            skills=skills,
+            keywords=tuple(skill.lower() for skill in skills),
+            cache_key='\x1f'.join(skills).encode('utf-8')
+        )
+    
+    def explain_batch(self,
+                      items: List[Tuple[ScoreBreakdown, Dict[str, Any], Optional[str]]],
+                      job_data: Dict[str, Any]) -> List[EnhancedExplanation]:
+        """
+        Explain many resumes against one job
+        
+        Args:
+            items: (score_breakdown, resume_data, resume_text) per resume
+            job_data: Parsed job data
+            
+        Returns:
+            EnhancedExplanation per item, in input order
+        """
+        job_ctx = self.precompute_job(job_data)
+        return [
+            self._explain_cached(score_breakdown, resume_data, job_ctx, resume_text)
+            for score_breakdown, resume_data, resume_text in items
+        ]
+    
+    def _explain_cached(self,
+                        score_breakdown: ScoreBreakdown,
+                        resume_data: Dict[str, Any],
+                        job_ctx: JobExplainContext,
+                        resume_text: Optional[str]) -> EnhancedExplanation:
+        """explain() against a precomputed job context"""
+        resume_text = resume_text or resume_data.get('text', '')
+        
+        # The explanation depends only on the breakdown, the resume text and
+        # the job's skills
+        key = hashlib.blake2b(
+            b'\x00'.join((
+                repr(score_breakdown).encode('utf-8'),
+                resume_text.encode('utf-8'),
+                job_ctx.cache_key
+            )),
+            digest_size=16
+        ).digest()
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+        
+        if result is None:
+            result = self._explain(score_breakdown, resume_data, job_ctx, resume_text)
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        # Only the mutable containers are copied; the rest of a cached
+        # explanation is immutable and shared (a deepcopy would cost more
+        # than recomputing)
+        return _copy_explanation(result)
+    
+    def _explain(self,
+                 score_breakdown: ScoreBreakdown,
+                 resume_data: Dict[str, Any],
+                 job_ctx: JobExplainContext,
+                 resume_text: str) -> EnhancedExplanation:
+        """Uncached explain()"""
+        job_data = job_ctx.job_data
+        
         # Generate summary
         summary = self._generate_enhanced_summary(score_breakdown)
         
@@ -237,9 +546,9 @@ class EnhancedExplainabilityEngine:
         
         # ATS compatibility check
         ats_compat = self._check_ats_compatibility(
-            resume_text or resume_data.get('text', ''),
+            resume_text,
             resume_data,
-            job_data
+            job_ctx.keywords
         )
         
         # Career insights
@@ -265,12 +574,13 @@ class EnhancedExplainabilityEngine:
         return EnhancedExplanation(
             summary=summary,
             score_explanations=score_explanations,
-            skill_analysis=skill_analysis,
+            skill_analysis=tuple(skill_analysis),
             ats_compatibility=ats_compat,
             career_insights=career_insights,
-            recommendations=recommendations,
-            learning_roadmap=learning_roadmap,
-            industry_benchmark=industry_benchmark
+            recommendations=tuple(recommendations),
+            learning_roadmap=tuple(learning_roadmap),
+            industry_benchmark=industry_benchmark,
+            score_explanations_list=tuple(score_explanations.items())
         )
     
     def _generate_enhanced_summary(self, score_breakdown: ScoreBreakdown) -> str:
@@ -278,21 +588,7 @@ class EnhancedExplainabilityEngine:
         score = score_breakdown.overall_score
         confidence = score_breakdown.confidence
         
-        if score >= 85:
-            quality = "exceptional"
-            action = "This candidate should be prioritized for immediate interview."
-        elif score >= 70:
-            quality = "strong"
-            action = "This candidate is well-qualified and recommended for interview."
-        elif score >= 60:
-            quality = "moderate"
-            action = "This candidate may be suitable depending on team needs and other applicants."
-        elif score >= 50:
-            quality = "fair"
-            action = "This candidate has some relevant experience but significant gaps exist."
-        else:
-            quality = "weak"
-            action = "This candidate does not meet the minimum requirements for this role."
+        quality, action = SUMMARY_LEVELS[bisect_right(SUMMARY_THRESHOLDS, score)]
         
         confidence_text = "high" if confidence >= 0.7 else "moderate" if confidence >= 0.5 else "low"
         
@@ -317,130 +613,43 @@ class EnhancedExplainabilityEngine:
         # Semantic Similarity (30%)
         sem_score = score_breakdown.semantic_similarity * 100
         explanations['Semantic Similarity (30% weight)'] = (
-            f"**Score: {sem_score:.1f}/100**\n\n"
-            f"**What this measures:** How well the overall content and context of the resume "
-            f"matches the job description using AI language understanding. This goes beyond "
-            f"keyword matching to understand meaning and relevance.\n\n"
-            f"**What it means:** "
+            f"**Score: {sem_score:.1f}/100**\n\n{SEMANTIC_MEASURES}"
+            f"{SEMANTIC_VERDICTS[bisect_right(SEMANTIC_THRESHOLDS, sem_score)]}"
         )
         
-        if sem_score >= 80:
-            explanations['Semantic Similarity (30% weight)'] += (
-                "Excellent alignment! The resume demonstrates experience and language that "
-                "closely matches what the employer is looking for. The candidate speaks the "
-                "same 'language' as the job requirements."
-            )
-        elif sem_score >= 60:
-            explanations['Semantic Similarity (30% weight)'] += (
-                "Good alignment. The resume addresses most requirements with relevant experience, "
-                "though some areas could be better articulated using job description terminology."
-            )
-        else:
-            explanations['Semantic Similarity (30% weight)'] += (
-                "Limited alignment. The resume content differs significantly from job requirements. "
-                "Consider rephrasing experience to better match the role's language and focus areas."
-            )
-        
         # Skill Match (35%)
         skill_score = score_breakdown.skill_match_score * 100
         matched_count = len(score_breakdown.matched_skills)
-        total_required = matched_count + len(score_breakdown.missing_skills)
-        
+        missing_count = len(score_breakdown.missing_skills)
+        total_required = matched_count + missing_count
+        verdict = SKILL_MATCH_VERDICTS[bisect_right(SKILL_MATCH_THRESHOLDS, skill_score)]
         explanations['Skill Match (35% weight)'] = (
             f"**Score: {skill_score:.1f}/100** ({matched_count}/{total_required} required skills)\n\n"
-            f"**What this measures:** Percentage of required technical and soft skills present "
-            f"in the resume.\n\n"
-            f"**What it means:** "
+            f"{SKILL_MATCH_MEASURES}"
+            f"{verdict.format(matched=matched_count, total=total_required, missing=missing_count)}"
         )
         
-        if skill_score >= 80:
-            explanations['Skill Match (35% weight)'] += (
-                f"Excellent! {matched_count} of {total_required} required skills matched. "
-                "This candidate has most of the technical capabilities needed for this role."
-            )
-        elif skill_score >= 50:
-            explanations['Skill Match (35% weight)'] += (
-                f"Partial match. {matched_count} of {total_required} skills found. "
-                f"Missing {len(score_breakdown.missing_skills)} key skills that should be "
-                "developed or added to resume if possessed."
-            )
-        else:
-            explanations['Skill Match (35% weight)'] += (
-                f"Weak match. Only {matched_count} of {total_required} required skills found. "
-                "Significant skill gaps exist for this particular role."
-            )
-        
         # Experience (20%)
         exp_score = score_breakdown.experience_score * 100
         explanations['Experience Level (20% weight)'] = (
-            f"**Score: {exp_score:.1f}/100**\n\n"
-            f"**What this measures:** Years of relevant professional experience and career progression.\n\n"
-            f"**What it means:** "
+            f"**Score: {exp_score:.1f}/100**\n\n{EXPERIENCE_MEASURES}"
+            f"{EXPERIENCE_VERDICTS[bisect_right(EXPERIENCE_THRESHOLDS, exp_score)]}"
         )
         
-        if exp_score >= 80:
-            explanations['Experience Level (20% weight)'] += (
-                "Strong experience match! The candidate has the required years of experience "
-                "and demonstrates career growth."
-            )
-        elif exp_score >= 50:
-            explanations['Experience Level (20% weight)'] += (
-                "Moderate experience. The candidate may have slightly less experience than ideal, "
-                "but could still be viable depending on skill strength."
-            )
-        else:
-            explanations['Experience Level (20% weight)'] += (
-                "Limited experience for this role. The position may require more years or "
-                "more senior-level experience than currently demonstrated."
-            )
-        
         # Education (10%)
         edu_score = score_breakdown.education_score * 100
         explanations['Education (10% weight)'] = (
-            f"**Score: {edu_score:.1f}/100**\n\n"
-            f"**What this measures:** Educational background alignment with job requirements.\n\n"
-            f"**What it means:** "
+            f"**Score: {edu_score:.1f}/100**\n\n{EDUCATION_MEASURES}"
+            f"{EDUCATION_VERDICTS[bisect_right(EDUCATION_THRESHOLDS, edu_score)]}"
         )
         
-        if edu_score >= 80:
-            explanations['Education (10% weight)'] += (
-                "Education requirements met. The candidate has the appropriate educational background."
-            )
-        elif edu_score >= 30:
-            explanations['Education (10% weight)'] += (
-                "Education information present but may not perfectly match requirements. "
-                "Experience can often compensate for educational differences."
-            )
-        else:
-            explanations['Education (10% weight)'] += (
-                "Education section unclear or missing. If you have relevant education, "
-                "ensure it's prominently listed."
-            )
-        
         # Keywords (5%)
         kw_score = score_breakdown.keyword_score * 100
         explanations['Keyword Match (5% weight)'] = (
-            f"**Score: {kw_score:.1f}/100**\n\n"
-            f"**What this measures:** Presence of exact keywords from job description (important for ATS systems).\n\n"
-            f"**What it means:** "
+            f"**Score: {kw_score:.1f}/100**\n\n{KEYWORD_MEASURES}"
+            f"{KEYWORD_VERDICTS[bisect_right(KEYWORD_THRESHOLDS, kw_score)]}"
         )
         
-        if kw_score >= 70:
-            explanations['Keyword Match (5% weight)'] += (
-                "Good keyword optimization. Resume uses terminology from the job description "
-                "that will help it pass automated screening systems (ATS)."
-            )
-        elif kw_score >= 40:
-            explanations['Keyword Match (5% weight)'] += (
-                "Moderate keyword usage. Consider incorporating more exact phrases from the "
-                "job description to improve ATS compatibility."
-            )
-        else:
-            explanations['Keyword Match (5% weight)'] += (
-                "Low keyword match. Resume may struggle with automated screening systems. "
-                "Add more specific keywords from the job posting."
-            )
-        
         return explanations
     
     def _analyze_skills_detailed(self,
@@ -449,65 +658,63 @@ class EnhancedExplainabilityEngine:
                                  job_data: Dict[str, Any]) -> List[SkillAnalysis]:
         """Create detailed analysis for each skill"""
         analyses = []
+        # Tables are looked up once per call, not once per skill
+        skill_info = self._skill_info
+        learning_resources = self.LEARNING_RESOURCES
         
         # Analyze matched skills
         for skill in matched_skills:
-            skill_lower = skill.lower()
-            skill_info = self.SKILL_IMPORTANCE.get(skill_lower, {
-                'importance': 'Important',
-                'demand': 'Stable',
-                'learning_time': 'Varies'
-            })
+            importance, demand, _ = skill_info.get(skill.lower(), DEFAULT_SKILL_INFO)
             
             analyses.append(SkillAnalysis(
                 skill_name=skill,
                 is_matched=True,
-                importance=skill_info['importance'],
-                reason=f"✅ You have this skill - great! This is {skill_info['importance'].lower()} "
-                       f"for the role and shows {skill_info['demand'].lower()} in the job market.",
-                market_demand=skill_info['demand'],
-                learning_resources=[],
+                importance=importance,
+                reason=f"✅ You have this skill - great! This is {importance.lower()} "
+                       f"for the role and shows {demand.lower()} in the job market.",
+                market_demand=demand,
+                learning_resources=(),
                 estimated_learning_time=None
             ))
         
         # Analyze missing skills with learning resources
         for skill in missing_skills:
             skill_lower = skill.lower()
-            skill_info = self.SKILL_IMPORTANCE.get(skill_lower, {
-                'importance': 'Important',
-                'demand': 'Stable',
-                'learning_time': 'Varies'
-            })
+            importance, demand, learning_time = skill_info.get(
+                skill_lower, DEFAULT_SKILL_INFO
+            )
             
-            resources = self.LEARNING_RESOURCES.get(skill_lower, [
-                f'Search for "{skill} tutorial" on YouTube or Udemy',
-                f'Check {skill} documentation',
-                f'FreeCodeCamp or Codecademy for {skill}'
-            ])
+            # Fallback resources are only formatted for unknown skills
+            resources = learning_resources.get(skill_lower)
+            if resources is None:
+                resources = tuple(
+                    template.format(skill) for template in DEFAULT_LEARNING_RESOURCES
+                )
             
-            reason = self._generate_skill_missing_reason(skill, skill_info)
+            reason = self._generate_skill_missing_reason(skill, importance, demand)
             
             analyses.append(SkillAnalysis(
                 skill_name=skill,
                 is_matched=False,
-                importance=skill_info['importance'],
+                importance=importance,
                 reason=reason,
-                market_demand=skill_info['demand'],
+                market_demand=demand,
                 learning_resources=resources,
-                estimated_learning_time=skill_info['learning_time']
+                estimated_learning_time=learning_time
             ))
         
-        # Sort by importance (Critical first)
+        # Order matched before missing, then by importance (Critical first);
+        # a stable partition into buckets, so no sort or key calls needed
         importance_order = {'Critical': 0, 'Important': 1, 'Beneficial': 2}
-        analyses.sort(key=lambda x: (not x.is_matched, importance_order.get(x.importance, 3)))
+        buckets = [[] for _ in range(8)]
+        for analysis in analyses:
+            rank = importance_order.get(analysis.importance, 3)
+            buckets[rank if analysis.is_matched else rank + 4].append(analysis)
         
-        return analyses
+        return [analysis for bucket in buckets for analysis in bucket]
     
-    def _generate_skill_missing_reason(self, skill: str, skill_info: Dict) -> str:
+    def _generate_skill_missing_reason(self, skill: str, importance: str, demand: str) -> str:
         """Generate explanation for why a missing skill matters"""
-        importance = skill_info['importance']
-        demand = skill_info['demand']
-        
         if importance == 'Critical':
             return (
                 f"❌ **CRITICAL SKILL MISSING** - {skill} is essential for this role. "
@@ -529,7 +736,7 @@ class EnhancedExplainabilityEngine:
     def _check_ats_compatibility(self,
                                  resume_text: str,
                                  resume_data: Dict[str, Any],
-                                 job_data: Dict[str, Any]) -> ATSCompatibility:
+                                 job_keywords: Tuple[str, ...]) -> ATSCompatibility:
         """
         Check if resume is ATS (Applicant Tracking System) friendly
         """
@@ -555,31 +762,30 @@ class EnhancedExplainabilityEngine:
             formatting_score -= 30
         
         # Check for standard sections
-        standard_sections = ['experience', 'education', 'skills']
         resume_lower = resume_text.lower()
-        missing_sections = []
-        
-        for section in standard_sections:
-            if section not in resume_lower:
-                missing_sections.append(section.title())
+        missing_sections = [
+            section.title() for section in STANDARD_SECTIONS
+            if section not in resume_lower
+        ]
         
         if missing_sections:
             issues.append(f"Standard sections may be missing or not clearly labeled: {', '.join(missing_sections)}")
             recommendations.append(f"Add clear section headers: {', '.join(missing_sections)}")
             formatting_score -= (len(missing_sections) * 10)
         
-        # Check for headers/footers (can confuse ATS)
-        lines = resume_text.split('\n')
-        if len(lines) > 5:
+        # Check for headers/footers (can confuse ATS); only the first and
+        # last lines are compared, so the text isn't split into lines
+        if resume_text.count('\n') >= 5:
             # Check if first/last lines repeat (possible header/footer)
-            if lines[0] == lines[-1]:
+            if resume_text.partition('\n')[0] == resume_text.rpartition('\n')[2]:
                 issues.append("Possible header/footer detected - may confuse ATS")
                 recommendations.append("Remove headers and footers, or use simple text only")
                 formatting_score -= 10
         
         # Check for special characters
-        special_chars = ['§', '©', '®', '™', '•']
-        found_special = [char for char in special_chars if char in resume_text]
+        # A substring test per character beats building set(resume_text):
+        # each is a C-level memchr-style scan and the list is short
+        found_special = [char for char in ATS_SPECIAL_CHARS if char in resume_text]
         if found_special:
             issues.append(f"Special characters found: {', '.join(found_special)} - may not parse correctly")
             recommendations.append("Replace special characters with standard text (e.g., (C) instead of ©)")
@@ -589,18 +795,17 @@ class EnhancedExplainabilityEngine:
         # Note: This would require file metadata, assuming good format for now
         
         # Check keyword optimization
-        job_skills = job_data.get('skills', [])
-        job_text_lower = job_data.get('text', '').lower()
-        keywords_found = sum(1 for skill in job_skills if skill.lower() in resume_lower)
-        keyword_optimization = (keywords_found / len(job_skills) * 100) if job_skills else 50
+        found_keywords = _keywords_in_text(job_keywords, resume_lower)
+        keywords_found = sum(1 for keyword in job_keywords if keyword in found_keywords)
+        keyword_optimization = (keywords_found / len(job_keywords) * 100) if job_keywords else 50
         
         if keyword_optimization < 50:
-            issues.append(f"Only {keywords_found}/{len(job_skills)} key skills mentioned explicitly")
+            issues.append(f"Only {keywords_found}/{len(job_keywords)} key skills mentioned explicitly")
             recommendations.append("Add more keywords from the job description to improve ATS matching")
         
         # Check for contact information
-        has_email = '@' in resume_text and '.' in resume_text
-        has_phone = re.search(r'\d{3}[-.]?\d{3}[-.]?\d{4}', resume_text)
+        has_email = _EMAIL_RE.search(resume_text)
+        has_phone = _PHONE_RE.search(resume_text)
         
         if not has_email:
             issues.append("Email address not clearly visible")
@@ -622,8 +827,8 @@ class EnhancedExplainabilityEngine:
         return ATSCompatibility(
             overall_score=max(0, overall_score),
             is_ats_friendly=is_ats_friendly,
-            issues=issues,
-            recommendations=recommendations,
+            issues=tuple(issues),
+            recommendations=tuple(recommendations),
             formatting_score=max(0, formatting_score),
             keyword_optimization=keyword_optimization
         )
@@ -633,32 +838,27 @@ class EnhancedExplainabilityEngine:
                                   resume_data: Dict[str, Any],
                                   job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate career progression and fit insights"""
-        insights = {
-            'career_level': 'Unknown',
-            'role_fit': 'Unknown',
-            'growth_potential': [],
-            'alternative_roles': []
-        }
+        # Insights are gathered in locals and put in the dict once at the end
         
         # Determine career level from experience
         exp_score = score_breakdown.experience_score
         if exp_score >= 0.8:
-            insights['career_level'] = 'Senior/Lead level'
-            insights['alternative_roles'] = [
+            career_level = 'Senior/Lead level'
+            alternative_roles = [
                 'Senior Software Engineer',
                 'Tech Lead',
                 'Engineering Manager'
             ]
         elif exp_score >= 0.5:
-            insights['career_level'] = 'Mid-level'
-            insights['alternative_roles'] = [
+            career_level = 'Mid-level'
+            alternative_roles = [
                 'Software Engineer',
                 'Backend Developer',
                 'Full Stack Developer'
             ]
         else:
-            insights['career_level'] = 'Junior/Entry level'
-            insights['alternative_roles'] = [
+            career_level = 'Junior/Entry level'
+            alternative_roles = [
                 'Junior Developer',
                 'Associate Engineer',
                 'Software Engineer I'
@@ -667,29 +867,33 @@ class EnhancedExplainabilityEngine:
         # Role fit analysis
         overall_score = score_breakdown.overall_score
         if overall_score >= 75:
-            insights['role_fit'] = 'Excellent fit for this specific role'
+            role_fit = 'Excellent fit for this specific role'
         elif overall_score >= 60:
-            insights['role_fit'] = 'Good fit with some development areas'
+            role_fit = 'Good fit with some development areas'
         elif overall_score >= 45:
-            insights['role_fit'] = 'Moderate fit - consider lateral moves or skill development'
+            role_fit = 'Moderate fit - consider lateral moves or skill development'
         else:
-            insights['role_fit'] = 'Limited fit - significant reskilling needed or explore different roles'
+            role_fit = 'Limited fit - significant reskilling needed or explore different roles'
         
         # Growth potential
-        matched_skills = len(score_breakdown.matched_skills)
         missing_skills = len(score_breakdown.missing_skills)
         
         if missing_skills <= 2:
-            insights['growth_potential'].append('Close to role requirements - minimal upskilling needed')
+            growth_potential = ['Close to role requirements - minimal upskilling needed']
         elif missing_skills <= 5:
-            insights['growth_potential'].append('3-6 months of focused learning could close skill gaps')
+            growth_potential = ['3-6 months of focused learning could close skill gaps']
         else:
-            insights['growth_potential'].append('6-12 months of learning recommended to meet requirements')
+            growth_potential = ['6-12 months of learning recommended to meet requirements']
         
         if score_breakdown.skill_match_score >= 0.7:
-            insights['growth_potential'].append('Strong foundation - ready for advanced topics')
+            growth_potential.append('Strong foundation - ready for advanced topics')
         
-        return insights
+        return {
+            'career_level': career_level,
+            'role_fit': role_fit,
+            'growth_potential': growth_potential,
+            'alternative_roles': alternative_roles
+        }
     
     def _generate_detailed_recommendations(self,
                                           score_breakdown: ScoreBreakdown,
@@ -706,9 +910,13 @@ class EnhancedExplainabilityEngine:
             )
         
         # Skill-based recommendations
-        critical_missing = [s for s in skill_analysis if not s.is_matched and s.importance == 'Critical']
+        # Only the first three are named, so stop scanning once they're found
+        critical_missing = list(islice(
+            (s for s in skill_analysis if not s.is_matched and s.importance == 'Critical'),
+            3
+        ))
         if critical_missing:
-            skills_list = ', '.join([s.skill_name for s in critical_missing[:3]])
+            skills_list = ', '.join([s.skill_name for s in critical_missing])
             recommendations.append(
                 f"📚 **Learn Critical Skills:** Focus on {skills_list}. "
                 f"These are essential for the role and in high demand."
@@ -748,13 +956,16 @@ class EnhancedExplainabilityEngine:
         """Create prioritized learning roadmap for missing skills"""
         roadmap = []
         
-        # Filter missing skills and prioritize
-        missing = [s for s in skill_analysis if not s.is_matched]
-        
-        # Group by priority
-        critical = [s for s in missing if s.importance == 'Critical']
-        important = [s for s in missing if s.importance == 'Important']
-        beneficial = [s for s in missing if s.importance == 'Beneficial']
+        # Group missing skills by priority in one pass
+        groups = {'Critical': [], 'Important': [], 'Beneficial': []}
+        for skill in skill_analysis:
+            if not skill.is_matched:
+                group = groups.get(skill.importance)
+                if group is not None:
+                    group.append(skill)
+        critical = groups['Critical']
+        important = groups['Important']
+        beneficial = groups['Beneficial']
         
         phase = 1
         
@@ -805,44 +1016,27 @@ class EnhancedExplainabilityEngine:
     def _generate_benchmark(self, score_breakdown: ScoreBreakdown) -> Dict[str, Any]:
         """Generate industry benchmark comparison"""
         score = score_breakdown.overall_score
+        # One lookup gives both the percentile and its interpretation
+        level = bisect_right(PERCENTILE_THRESHOLDS, score)
         
-        # Simulated benchmark data (in production, this would come from real data)
         return {
             'your_score': score,
-            'average_applicant': 62,
-            'top_10_percent': 82,
-            'top_25_percent': 74,
-            'percentile': self._calculate_percentile(score),
-            'interpretation': self._get_benchmark_interpretation(score)
+            **INDUSTRY_BENCHMARK,
+            'percentile': PERCENTILES[level],
+            'interpretation': BENCHMARK_INTERPRETATIONS[level]
         }
     
-    def _calculate_percentile(self, score: float) -> int:
-        """Calculate approximate percentile based on score"""
-        # Simplified percentile calculation
-        if score >= 85:
-            return 95
-        elif score >= 75:
-            return 80
-        elif score >= 65:
-            return 60
-        elif score >= 55:
-            return 40
-        elif score >= 45:
-            return 25
-        else:
-            return 10
-    
-    def _get_benchmark_interpretation(self, score: float) -> str:
-        """Interpret benchmark position"""
-        percentile = self._calculate_percentile(score)
-        
-        if percentile >= 90:
-            return "You're in the top 10% of applicants for this role!"
-        elif percentile >= 75:
-            return "You're above average and competitive for this position."
-        elif percentile >= 50:
-            return "You're around the average applicant for this role."
-        elif percentile >= 25:
-            return "You're below average. Focus on skill development to improve."
-        else:
-            return "Significant gaps exist. Consider additional training or different roles."
+    def percentile_batch(self, scores) -> np.ndarray:
+        """
+        Approximate percentiles for many overall scores at once
+        
+        Args:
+            scores: Overall scores (0-100), any array-like
+            
+        Returns:
+            Integer array of percentiles, one per score
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        return _PERCENTILES_NP[
+            np.searchsorted(_PERCENTILE_THRESHOLDS_NP, scores, side='right')
+        ]
@@ -3,8 +3,10 @@ Explainability Module for Resume Screening
 Provides detailed explanations for matching results
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence, Tuple
 from dataclasses import dataclass
+from bisect import bisect_right
+from functools import lru_cache
 import logging
 
 from ..scoring.scoring_engine import ScoreBreakdown
@@ -12,6 +14,75 @@ from ..scoring.scoring_engine import ScoreBreakdown
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Report rules around the whole report and under each section title
+REPORT_RULE = "=" * 80
+SECTION_RULE = "-" * 80
+
+# Match quality (quality, verb) by overall score, from worst to best
+MATCH_THRESHOLDS = (55, 70, 85)
+MATCH_QUALITIES = (
+    ("weak", "does not strongly match"),
+    ("moderate", "partially matches"),
+    ("strong", "matches well with"),
+    ("excellent", "strongly matches")
+)
+CONFIDENCE_THRESHOLDS = (0.5, 0.7)
+CONFIDENCE_LEVELS = ("low", "moderate", "high")
+
+# Component analyses from worst to best, picked by where the component's
+# percentage falls among its thresholds; each is a (lead, tail) pair around
+# the formatted percentage
+SEMANTIC_THRESHOLDS = (60, 80)
+SEMANTIC_ANALYSES = (
+    ("Limited alignment", ". The resume content differs "
+     "significantly from what the job description requires."),
+    ("Good alignment", ". The resume addresses most job "
+     "requirements with relevant experience and skills."),
+    ("Excellent alignment", ". The resume content closely "
+     "matches the job description's requirements and terminology.")
+)
+SKILL_THRESHOLDS = (50, 80)
+EXPERIENCE_THRESHOLDS = (70, 90)
+EXPERIENCE_ANALYSES = (
+    ("Experience level may be insufficient", "."),
+    ("Adequate experience level", ", though may be slightly below optimal."),
+    ("Meets or exceeds experience requirements", ".")
+)
+EDUCATION_THRESHOLDS = (70, 90)
+EDUCATION_ANALYSES = (
+    ("Education level may not meet requirements", "."),
+    ("Education level is close to requirements", "."),
+    ("Meets education requirements", ".")
+)
+
+# Hiring recommendations by overall score, from worst to best
+HIRING_THRESHOLDS = (55, 70, 85)
+HIRING_RECOMMENDATIONS = (
+    ("❌ Not recommended for this position",
+     "Significant gaps in required qualifications"),
+    ("⚠️ Consider if willing to train on missing skills",
+     "May be suitable for junior/mid-level variant of role"),
+    ("✅ Recommend phone screening to assess fit",
+     "Verify experience with missing skills during interview"),
+    ("✅ Highly recommend scheduling an interview - strong candidate",
+     "Focus interview on validating top skills and cultural fit")
+)
+
+# Resume improvement suggestions, one pair per weak area
+SKILL_SUGGESTION = "💡 Highlight projects demonstrating these missing skills"
+SEMANTIC_SUGGESTIONS = (
+    "💡 Tailor resume language to better match job description terminology",
+    "💡 Add keywords and phrases from the job posting"
+)
+EXPERIENCE_SUGGESTIONS = (
+    "💡 Emphasize relevant experience more prominently",
+    "💡 Quantify achievements with metrics and impact"
+)
+GENERAL_SUGGESTIONS = (
+    "💡 Consider adding a summary section targeting this role",
+    "💡 Reorganize to prioritize most relevant experience"
+)
+
 
 @dataclass
 class Explanation:
@@ -23,6 +94,18 @@ class Explanation:
     improvement_suggestions: List[str]
 
 
+# Screening one job repeats the same top skill lists across resumes, so
+# formatting is memoized on the (hashable) skill tuple
+@lru_cache(maxsize=4096)
+def _format_skills(skills: Tuple[str, ...]) -> str:
+    """Format a skill tuple for display"""
+    if not skills:
+        return "none"
+    if len(skills) <= 3:
+        return ", ".join(skills)
+    return ", ".join(skills[:3]) + f" (and {len(skills)-3} more)"
+
+
 class ExplainabilityEngine:
     """Generate human-readable explanations for matching results"""
     
@@ -77,20 +160,9 @@ class ExplainabilityEngine:
         confidence = score_breakdown.confidence
         
         # Determine match quality
-        if score >= 85:
-            quality = "excellent"
-            verb = "strongly matches"
-        elif score >= 70:
-            quality = "strong"
-            verb = "matches well with"
-        elif score >= 55:
-            quality = "moderate"
-            verb = "partially matches"
-        else:
-            quality = "weak"
-            verb = "does not strongly match"
+        quality, verb = MATCH_QUALITIES[bisect_right(MATCH_THRESHOLDS, score)]
         
-        confidence_text = "high" if confidence >= 0.7 else "moderate" if confidence >= 0.5 else "low"
+        confidence_text = CONFIDENCE_LEVELS[bisect_right(CONFIDENCE_THRESHOLDS, confidence)]
         
         summary = (
             f"This resume {verb} the job requirements with an overall score of "
@@ -110,33 +182,20 @@ class ExplainabilityEngine:
         
         # Semantic Similarity
         sem_score = score_breakdown.semantic_similarity * 100
-        if sem_score >= 80:
-            analysis['Semantic Match'] = (
-                f"Excellent alignment ({sem_score:.1f}%). The resume content closely "
-                "matches the job description's requirements and terminology."
-            )
-        elif sem_score >= 60:
-            analysis['Semantic Match'] = (
-                f"Good alignment ({sem_score:.1f}%). The resume addresses most job "
-                "requirements with relevant experience and skills."
-            )
-        else:
-            analysis['Semantic Match'] = (
-                f"Limited alignment ({sem_score:.1f}%). The resume content differs "
-                "significantly from what the job description requires."
-            )
+        lead, tail = SEMANTIC_ANALYSES[bisect_right(SEMANTIC_THRESHOLDS, sem_score)]
+        analysis['Semantic Match'] = f"{lead} ({sem_score:.1f}%){tail}"
         
         # Skill Match
         skill_score = score_breakdown.skill_match_score * 100
         matched_count = len(score_breakdown.matched_skills)
         missing_count = len(score_breakdown.missing_skills)
-        
-        if skill_score >= 80:
+        level = bisect_right(SKILL_THRESHOLDS, skill_score)
+        if level == 2:
             analysis['Skills'] = (
                 f"Strong skill match ({skill_score:.1f}%). {matched_count} key skills "
                 f"matched. {self._format_skill_list(score_breakdown.matched_skills[:5])}"
             )
-        elif skill_score >= 50:
+        elif level == 1:
             analysis['Skills'] = (
                 f"Partial skill match ({skill_score:.1f}%). {matched_count} skills matched, "
                 f"but {missing_count} required skills are missing: "
@@ -150,68 +209,22 @@ class ExplainabilityEngine:
         
         # Experience
         exp_score = score_breakdown.experience_score * 100
-        if exp_score >= 90:
-            analysis['Experience'] = (
-                f"Meets or exceeds experience requirements ({exp_score:.1f}%)."
-            )
-        elif exp_score >= 70:
-            analysis['Experience'] = (
-                f"Adequate experience level ({exp_score:.1f}%), though may be "
-                "slightly below optimal."
-            )
-        else:
-            analysis['Experience'] = (
-                f"Experience level may be insufficient ({exp_score:.1f}%)."
-            )
+        lead, tail = EXPERIENCE_ANALYSES[bisect_right(EXPERIENCE_THRESHOLDS, exp_score)]
+        analysis['Experience'] = f"{lead} ({exp_score:.1f}%){tail}"
         
         # Education
         edu_score = score_breakdown.education_score * 100
-        if edu_score >= 90:
-            analysis['Education'] = f"Meets education requirements ({edu_score:.1f}%)."
-        elif edu_score >= 70:
-            analysis['Education'] = (
-                f"Education level is close to requirements ({edu_score:.1f}%)."
-            )
-        else:
-            analysis['Education'] = (
-                f"Education level may not meet requirements ({edu_score:.1f}%)."
-            )
+        lead, tail = EDUCATION_ANALYSES[bisect_right(EDUCATION_THRESHOLDS, edu_score)]
+        analysis['Education'] = f"{lead} ({edu_score:.1f}%){tail}"
         
         return analysis
     
     def _generate_recommendations(self, score_breakdown: ScoreBreakdown) -> List[str]:
         """Generate actionable recommendations"""
-        recommendations = []
         score = score_breakdown.overall_score
-        
-        if score >= 85:
-            recommendations.append(
-                "✅ Highly recommend scheduling an interview - strong candidate"
-            )
-            recommendations.append(
-                "Focus interview on validating top skills and cultural fit"
-            )
-        elif score >= 70:
-            recommendations.append(
-                "✅ Recommend phone screening to assess fit"
-            )
-            recommendations.append(
-                "Verify experience with missing skills during interview"
-            )
-        elif score >= 55:
-            recommendations.append(
-                "⚠️ Consider if willing to train on missing skills"
-            )
-            recommendations.append(
-                "May be suitable for junior/mid-level variant of role"
-            )
-        else:
-            recommendations.append(
-                "❌ Not recommended for this position"
-            )
-            recommendations.append(
-                "Significant gaps in required qualifications"
-            )
+        recommendations = list(
+            HIRING_RECOMMENDATIONS[bisect_right(HIRING_THRESHOLDS, score)]
+        )
         
         # Add specific recommendations based on weaknesses
         if score_breakdown.missing_skills:
@@ -224,25 +237,28 @@ class ExplainabilityEngine:
     def _identify_key_factors(self, score_breakdown: ScoreBreakdown) -> List[str]:
         """Identify factors most influencing the score"""
         factors = []
+        skill_score = score_breakdown.skill_match_score
+        sem_score = score_breakdown.semantic_similarity
+        exp_score = score_breakdown.experience_score
         
         # Add positive factors
-        if score_breakdown.skill_match_score >= 0.8:
+        if skill_score >= 0.8:
             factors.append(f"✓ Strong skill alignment ({len(score_breakdown.matched_skills)} matches)")
         
-        if score_breakdown.semantic_similarity >= 0.8:
+        if sem_score >= 0.8:
             factors.append("✓ Excellent semantic match with job description")
         
-        if score_breakdown.experience_score >= 0.9:
+        if exp_score >= 0.9:
             factors.append("✓ Meets experience requirements")
         
         # Add negative factors
-        if score_breakdown.skill_match_score < 0.5:
+        if skill_score < 0.5:
             factors.append(f"✗ Missing critical skills ({len(score_breakdown.missing_skills)} gaps)")
         
-        if score_breakdown.semantic_similarity < 0.5:
+        if sem_score < 0.5:
             factors.append("✗ Resume content differs from job requirements")
         
-        if score_breakdown.experience_score < 0.7:
+        if exp_score < 0.7:
             factors.append("✗ May lack required experience level")
         
         return factors
@@ -260,47 +276,26 @@ class ExplainabilityEngine:
             suggestions.append(
                 f"💡 Add these skills if applicable: {', '.join(missing_top)}"
             )
-            suggestions.append(
-                "💡 Highlight projects demonstrating these missing skills"
-            )
+            suggestions.append(SKILL_SUGGESTION)
         
         # Semantic match suggestions
         if score_breakdown.semantic_similarity < 0.7:
-            suggestions.append(
-                "💡 Tailor resume language to better match job description terminology"
-            )
-            suggestions.append(
-                "💡 Add keywords and phrases from the job posting"
-            )
+            suggestions.extend(SEMANTIC_SUGGESTIONS)
         
         # Experience suggestions
         if score_breakdown.experience_score < 0.8:
-            suggestions.append(
-                "💡 Emphasize relevant experience more prominently"
-            )
-            suggestions.append(
-                "💡 Quantify achievements with metrics and impact"
-            )
+            suggestions.extend(EXPERIENCE_SUGGESTIONS)
         
         # General suggestions
         if score_breakdown.overall_score < 70:
-            suggestions.append(
-                "💡 Consider adding a summary section targeting this role"
-            )
-            suggestions.append(
-                "💡 Reorganize to prioritize most relevant experience"
-            )
+            suggestions.extend(GENERAL_SUGGESTIONS)
         
         return suggestions
     
     @staticmethod
-    def _format_skill_list(skills: List[str]) -> str:
+    def _format_skill_list(skills: Sequence[str]) -> str:
         """Format skill list for display"""
-        if not skills:
-            return "none"
-        if len(skills) <= 3:
-            return ", ".join(skills)
-        return ", ".join(skills[:3]) + f" (and {len(skills)-3} more)"
+        return _format_skills(tuple(skills))
     
     def generate_report(self, explanation: Explanation) -> str:
         """
@@ -314,27 +309,27 @@ class ExplainabilityEngine:
         """
         report = []
         
-        report.append("=" * 80)
+        report.append(REPORT_RULE)
         report.append("RESUME SCREENING REPORT")
-        report.append("=" * 80)
+        report.append(REPORT_RULE)
         report.append("")
         
         # Summary
         report.append("SUMMARY")
-        report.append("-" * 80)
+        report.append(SECTION_RULE)
         report.append(explanation.summary)
         report.append("")
         
         # Key Factors
         report.append("KEY FACTORS")
-        report.append("-" * 80)
+        report.append(SECTION_RULE)
         for factor in explanation.key_factors:
             report.append(f"  {factor}")
         report.append("")
         
         # Detailed Analysis
         report.append("DETAILED ANALYSIS")
-        report.append("-" * 80)
+        report.append(SECTION_RULE)
         for component, analysis in explanation.detailed_analysis.items():
             report.append(f"\n{component}:")
             report.append(f"  {analysis}")
@@ -342,7 +337,7 @@ class ExplainabilityEngine:
         
         # Recommendations
         report.append("RECOMMENDATIONS")
-        report.append("-" * 80)
+        report.append(SECTION_RULE)
         for rec in explanation.recommendations:
             report.append(f"  {rec}")
         report.append("")
@@ -350,12 +345,12 @@ class ExplainabilityEngine:
         # Improvement Suggestions
         if explanation.improvement_suggestions:
             report.append("IMPROVEMENT SUGGESTIONS")
-            report.append("-" * 80)
+            report.append(SECTION_RULE)
             for suggestion in explanation.improvement_suggestions:
                 report.append(f"  {suggestion}")
             report.append("")
         
-        report.append("=" * 80)
+        report.append(REPORT_RULE)
         
         return "\n".join(report)
 
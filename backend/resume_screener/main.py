@@ -3,9 +3,12 @@ Main Resume Analyzer - Orchestrates all components
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List
+from dataclasses import dataclass, field
 import logging
 
+import numpy as np
+
 from .models.nlp_models import SemanticMatcher
 from .parsers.document_parser import ResumeParser, JobDescriptionParser
 from .parsers.skill_extractor import SkillExtractor
@@ -16,6 +19,17 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class JobContext:
+    """Job description data computed once and reused across resumes"""
+    job_data: Dict[str, Any]
+    required_skills: List[str]
+    required_years: Optional[float]
+    required_education: Optional[str]
+    keywords: List[str] = field(default_factory=list)
+    embedding: Optional[np.ndarray] = None
+
+
 class AnalysisResult:
     """Container for analysis results"""
     
@@ -34,8 +48,11 @@ class AnalysisResult:
         self.explanation = explanation
         self.resume_data = resume_data
         self.job_data = job_data
+        self.confidence = score_breakdown.confidence
         self.matched_skills = score_breakdown.matched_skills
         self.missing_skills = score_breakdown.missing_skills
+        self.strengths = score_breakdown.strengths
+        self.weaknesses = score_breakdown.weaknesses
     
     def __repr__(self):
         return f"AnalysisResult(score={self.score:.1f}, classification='{self.classification}')"
@@ -90,7 +107,10 @@ class ResumeAnalyzer:
     def __init__(self, 
                  use_sbert: bool = True,
                  use_spacy: bool = True,
-                 custom_weights: Optional[Dict[str, float]] = None):
+                 custom_weights: Optional[Dict[str, float]] = None,
+                 quantize_embeddings: bool = False,
+                 embedding_url: Optional[str] = None,
+                 compile_embeddings: bool = False):
         """
         Initialize Resume Analyzer
         
@@ -98,11 +118,23 @@ class ResumeAnalyzer:
             use_sbert: Use Sentence-BERT for embeddings
             use_spacy: Use spaCy for skill extraction
             custom_weights: Custom scoring weights
+            quantize_embeddings: Run SBERT with int8 dynamic quantization on
+                CPU (FP32 when False)
+            embedding_url: URL of a text-embeddings-inference server to use
+                instead of loading SBERT in-process
+            compile_embeddings: Compile the SBERT forward with torch.compile
+                (adds startup time; ignored with quantize_embeddings on CPU)
         """
         logger.info("Initializing Resume Analyzer...")
         
         # Initialize components
-        self.semantic_matcher = SemanticMatcher(use_sbert=use_sbert, use_bert=False)
+        self.semantic_matcher = SemanticMatcher(
+            use_sbert=use_sbert,
+            use_bert=False,
+            quantize=quantize_embeddings,
+            embedding_url=embedding_url,
+            compile=compile_embeddings
+        )
         self.resume_parser = ResumeParser()
         self.job_parser = JobDescriptionParser()
         self.skill_extractor = SkillExtractor(use_spacy=use_spacy)
@@ -152,21 +184,152 @@ class ResumeAnalyzer:
         else:
             raise ValueError("Either job_description or job_path must be provided")
         
-        # Extract skills
-        logger.info("Extracting skills from resume and job description...")
-        resume_skills = self.skill_extractor.extract(resume_data['raw_text'])
-        job_skills = required_skills or self.skill_extractor.extract(job_data['raw_text'])
+        return self.analyze_parsed(
+            resume_data,
+            job_data,
+            required_skills=required_skills
+        )
+    
+    def analyze_bytes(self,
+                      data: bytes,
+                      extension: str,
+                      job_description: Optional[str] = None,
+                      job_path: Optional[str] = None,
+                      required_skills: Optional[list] = None) -> AnalysisResult:
+        """
+        Analyze an in-memory resume file (e.g. an upload) against a job description
         
-        logger.info(f"Found {len(resume_skills)} skills in resume")
+        Args:
+            data: Raw resume file content
+            extension: File extension including the dot (e.g. '.pdf')
+            job_description: Job description text
+            job_path: Path to job description file
+            required_skills: Optional list of required skills
+            
+        Returns:
+            AnalysisResult object
+        """
+        logger.info(f"Parsing resume from memory ({extension}, {len(data)} bytes)")
+        resume_data = self.resume_parser.parse_bytes(data, extension)
+        
+        if job_path:
+            job_data = self.job_parser.parse(job_path)
+        elif job_description:
+            job_data = self.job_parser.parse(job_description)
+        else:
+            raise ValueError("Either job_description or job_path must be provided")
+        
+        return self.analyze_parsed(
+            resume_data,
+            job_data,
+            required_skills=required_skills
+        )
+    
+    def analyze_parsed(self,
+                       resume_data: Dict[str, Any],
+                       job_data: Dict[str, Any],
+                       required_skills: Optional[list] = None,
+                       semantic_similarity: Optional[float] = None,
+                       resume_skills: Optional[list] = None) -> AnalysisResult:
+        """
+        Analyze already-parsed resume data against parsed job data
+        
+        Args:
+            resume_data: Parsed resume data (must contain 'raw_text')
+            job_data: Parsed job data (must contain 'raw_text')
+            required_skills: Optional list of required skills
+            semantic_similarity: Precomputed resume/job similarity (0-1);
+                skips the SBERT forward pass when provided
+            resume_skills: Skills already extracted from the resume
+            
+        Returns:
+            AnalysisResult object
+        """
+        job_context = self.precompute_job(
+            job_data,
+            required_skills=required_skills,
+            embed=False
+        )
+        return self.analyze_with_context(
+            resume_data,
+            job_context,
+            semantic_similarity=semantic_similarity,
+            resume_skills=resume_skills
+        )
+    
+    def precompute_job(self,
+                       job_data: Dict[str, Any],
+                       required_skills: Optional[list] = None,
+                       embed: bool = True) -> JobContext:
+        """
+        Extract everything the scoring needs from a job description once
+        
+        Args:
+            job_data: Parsed job data (must contain 'raw_text')
+            required_skills: Optional list of required skills
+            embed: Also compute the normalized SBERT embedding of the job text
+            
+        Returns:
+            JobContext to pass to analyze_with_context
+        """
+        job_text = job_data['raw_text']
+        job_skills = required_skills or self.skill_extractor.extract(job_text)
         logger.info(f"Found {len(job_skills)} required skills in job description")
         
-        # Semantic matching
-        logger.info("Computing semantic similarity...")
-        semantic_result = self.semantic_matcher.match_resume_to_job(
-            resume_data['raw_text'],
-            job_data['raw_text']
+        embedding = None
+        if embed and self.semantic_matcher.sbert_model:
+            embedding = self.encode_batch([job_text])[0]
+        
+        return JobContext(
+            job_data=job_data,
+            required_skills=job_skills,
+            required_years=self._extract_required_years(job_text),
+            required_education=self._extract_required_education(job_text),
+            keywords=self._extract_keywords(job_text),
+            embedding=embedding
         )
-        semantic_similarity = semantic_result['overall_similarity']
+    
+    def analyze_with_context(self,
+                             resume_data: Dict[str, Any],
+                             job_context: JobContext,
+                             semantic_similarity: Optional[float] = None,
+                             resume_skills: Optional[list] = None) -> AnalysisResult:
+        """
+        Analyze parsed resume data against a precomputed job context
+        
+        Args:
+            resume_data: Parsed resume data (must contain 'raw_text')
+            job_context: Result of precompute_job
+            semantic_similarity: Precomputed resume/job similarity (0-1);
+                skips the SBERT forward pass when provided
+            resume_skills: Skills already extracted from the resume
+            
+        Returns:
+            AnalysisResult object
+        """
+        job_data = job_context.job_data
+        job_skills = job_context.required_skills
+        
+        # Extract skills
+        logger.info("Extracting skills from resume...")
+        if resume_skills is None:
+            resume_skills = self.skill_extractor.extract(resume_data['raw_text'])
+        
+        logger.info(f"Found {len(resume_skills)} skills in resume")
+        
+        # Semantic matching (only the resume needs encoding when the job
+        # embedding was precomputed)
+        if semantic_similarity is None and job_context.embedding is not None:
+            logger.info("Computing semantic similarity...")
+            resume_embedding = self.encode_batch([resume_data['raw_text']])[0]
+            semantic_similarity = round(float(resume_embedding @ job_context.embedding), 4)
+        elif semantic_similarity is None:
+            logger.info("Computing semantic similarity...")
+            semantic_result = self.semantic_matcher.match_resume_to_job(
+                resume_data['raw_text'],
+                job_data['raw_text']
+            )
+            semantic_similarity = semantic_result['overall_similarity']
         
         # Skill matching
         logger.info("Matching skills...")
@@ -177,25 +340,22 @@ class ResumeAnalyzer:
         
         # Score experience
         resume_years = resume_data.get('experience_years')
-        required_years = self._extract_required_years(job_data['raw_text'])
         experience_score = self.scoring_engine.score_experience(
             resume_years,
-            required_years
+            job_context.required_years
         )
         
         # Score education
         resume_education = resume_data.get('education', [])
-        required_education = self._extract_required_education(job_data['raw_text'])
         education_score = self.scoring_engine.score_education(
             resume_education,
-            required_education
+            job_context.required_education
         )
         
         # Score keywords
-        job_keywords = self._extract_keywords(job_data['raw_text'])
         keyword_score = self.scoring_engine.score_keywords(
             resume_data['raw_text'],
-            job_keywords
+            job_context.keywords
         )
         
         # Calculate overall score
@@ -259,6 +419,80 @@ class ResumeAnalyzer:
             job_data=job_data
         )
     
+    def encode_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Encode texts with SBERT in a single batched forward pass
+        
+        Args:
+            texts: Texts to encode
+            batch_size: Batch size for encoding
+            
+        Returns:
+            L2-normalized embeddings (rows dot to cosine similarity)
+        """
+        if not self.semantic_matcher.sbert_model:
+            raise ValueError("SBERT model required for batch encoding")
+        
+        return self.semantic_matcher.sbert_model.encode(
+            texts,
+            batch_size=batch_size,
+            normalize=True
+        )
+    
+    def analyze_many(self,
+                     resume_data_list: List[Dict[str, Any]],
+                     job_data: Dict[str, Any],
+                     required_skills: Optional[list] = None,
+                     resume_skills_list: Optional[List[list]] = None) -> List[AnalysisResult]:
+        """
+        Analyze several parsed resumes against one parsed job description
+        
+        The job description is processed once into a JobContext, and it is
+        embedded together with all resumes so SBERT runs one batched pass
+        instead of one pass per resume.
+        
+        Args:
+            resume_data_list: Parsed resume data dictionaries
+            job_data: Parsed job data
+            required_skills: Optional list of required skills
+            resume_skills_list: Skills already extracted from each resume
+            
+        Returns:
+            List of AnalysisResult objects, in input order
+        """
+        if not resume_data_list:
+            return []
+        
+        job_context = self.precompute_job(
+            job_data,
+            required_skills=required_skills,
+            embed=False
+        )
+        
+        similarities = [None] * len(resume_data_list)
+        if resume_skills_list is None:
+            resume_skills_list = self.skill_extractor.extract_many(
+                [r['raw_text'] for r in resume_data_list]
+            )
+        if self.semantic_matcher.sbert_model:
+            logger.info(f"Encoding {len(resume_data_list)} resumes in one batch...")
+            embeddings = self.encode_batch(
+                [job_data['raw_text']] + [r['raw_text'] for r in resume_data_list]
+            )
+            job_context.embedding = embeddings[0]
+            similarities = [round(float(s), 4) for s in embeddings[1:] @ embeddings[0]]
+        
+        return [
+            self.analyze_with_context(
+                resume_data,
+                job_context,
+                semantic_similarity=similarity,
+                resume_skills=resume_skills
+            )
+            for resume_data, similarity, resume_skills
+            in zip(resume_data_list, similarities, resume_skills_list)
+        ]
+    
     def batch_analyze(self,
                      resume_paths: list,
                      job_description: str) -> list:
@@ -274,19 +508,18 @@ class ResumeAnalyzer:
         """
         logger.info(f"Starting batch analysis of {len(resume_paths)} resumes...")
         
-        results = []
+        resume_data_list = []
         for i, resume_path in enumerate(resume_paths, 1):
-            logger.info(f"Analyzing resume {i}/{len(resume_paths)}: {resume_path}")
+            logger.info(f"Parsing resume {i}/{len(resume_paths)}: {resume_path}")
             try:
-                result = self.analyze(
-                    resume_path=resume_path,
-                    job_description=job_description
-                )
-                results.append(result)
+                resume_data_list.append(self.resume_parser.parse(resume_path))
             except Exception as e:
                 logger.error(f"Error analyzing {resume_path}: {str(e)}")
                 continue
         
+        job_data = self.job_parser.parse(job_description)
+        results = self.analyze_many(resume_data_list, job_data)
+        
         # Sort by score (descending)
         results.sort(key=lambda x: x.score, reverse=True)
         
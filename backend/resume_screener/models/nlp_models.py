@@ -7,10 +7,15 @@ import torch
 from sentence_transformers import SentenceTransformer, util
 from transformers import AutoTokenizer, AutoModel
 import numpy as np
-from typing import List, Union, Tuple
+from typing import List, Optional, Union, Tuple
 import logging
 from pathlib import Path
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -18,22 +23,56 @@ logger = logging.getLogger(__name__)
 class EmbeddingModel:
     """Handles text embeddings using Sentence-BERT"""
     
-    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2'):
+    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2',
+                 quantize: bool = False,
+                 compile: bool = False):
         """
         Initialize the embedding model
         
         Args:
             model_name: HuggingFace model identifier
+            quantize: Apply dynamic int8 quantization to Linear layers
+                (CPU only; the model stays FP32 on GPU)
+            compile: Compile the transformer forward with torch.compile.
+                Compilation happens at startup via a warmup encode; ignored
+                when the model is quantized
         """
         logger.info(f"Loading embedding model: {model_name}")
         self.model = SentenceTransformer(model_name)
         self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
         self.model.to(self.device)
-        logger.info(f"Model loaded on device: {self.device}")
+        
+        self.quantized = False
+        if quantize and self.device == 'cpu':
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model,
+                {torch.nn.Linear},
+                dtype=torch.qint8
+            )
+            self.quantized = True
+        
+        self.compiled = False
+        if compile and not self.quantized:
+            transformer = self.model[0]
+            transformer.auto_model = torch.compile(
+                transformer.auto_model,
+                mode="reduce-overhead",
+                fullgraph=False
+            )
+            self.compiled = True
+            # Pay the compilation cost now rather than on the first request
+            self.encode(["warmup"])
+        elif compile:
+            logger.warning("torch.compile skipped: not supported for quantized model")
+        
+        logger.info(f"Model loaded on device: {self.device}"
+                    f"{' (int8 quantized)' if self.quantized else ''}"
+                    f"{' (compiled)' if self.compiled else ''}")
     
     def encode(self, texts: Union[str, List[str]], 
                batch_size: int = 32,
-               show_progress: bool = False) -> np.ndarray:
+               show_progress: bool = False,
+               normalize: bool = False) -> np.ndarray:
         """
         Generate embeddings for text(s)
         
@@ -41,6 +80,7 @@ class EmbeddingModel:
             texts: Single text or list of texts
             batch_size: Batch size for encoding
             show_progress: Show progress bar
+            normalize: L2-normalize embeddings (dot product == cosine)
             
         Returns:
             numpy array of embeddings
@@ -52,7 +92,8 @@ class EmbeddingModel:
             texts,
             batch_size=batch_size,
             show_progress_bar=show_progress,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=normalize
         )
         return embeddings
     
@@ -90,6 +131,97 @@ class EmbeddingModel:
         return similarity_matrix.cpu().numpy()
 
 
+class TEIEmbeddingModel:
+    """
+    Embeddings served by a text-embeddings-inference (TEI) sidecar
+    
+    Drop-in replacement for EmbeddingModel. Requests go through one pooled
+    HTTP client, so concurrent API calls reach TEI together and are packed
+    into shared forward passes by its dynamic batching.
+    """
+    
+    def __init__(self, base_url: str, timeout: float = 30.0, max_batch_size: int = 32):
+        """
+        Initialize the TEI client
+        
+        Args:
+            base_url: TEI server URL (e.g. 'http://localhost:8080')
+            timeout: Request timeout in seconds
+            max_batch_size: Maximum texts per /embed request
+                (should not exceed the server's --max-client-batch-size)
+        """
+        if httpx is None:
+            raise ImportError("httpx not installed. Install with: pip install httpx")
+        
+        self.base_url = base_url.rstrip('/')
+        self.max_batch_size = max_batch_size
+        self.client = httpx.Client(base_url=self.base_url, timeout=timeout)
+        self.device = 'remote'
+        self.quantized = False
+        logger.info(f"Using TEI embedding server: {self.base_url}")
+    
+    def encode(self, texts: Union[str, List[str]],
+               batch_size: int = 32,
+               show_progress: bool = False,
+               normalize: bool = False) -> np.ndarray:
+        """
+        Generate embeddings for text(s)
+        
+        Args:
+            texts: Single text or list of texts
+            batch_size: Batch size per request (capped at max_batch_size)
+            show_progress: Unused; kept for EmbeddingModel compatibility
+            normalize: L2-normalize embeddings (dot product == cosine)
+            
+        Returns:
+            numpy array of embeddings
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        
+        batch_size = min(batch_size, self.max_batch_size)
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            response = self.client.post('/embed', json={
+                'inputs': texts[start:start + batch_size],
+                'normalize': normalize,
+                'truncate': True
+            })
+            response.raise_for_status()
+            embeddings.extend(response.json())
+        
+        return np.asarray(embeddings, dtype=np.float32)
+    
+    def compute_similarity(self, text1: str, text2: str) -> float:
+        """
+        Compute cosine similarity between two texts
+        
+        Args:
+            text1: First text
+            text2: Second text
+            
+        Returns:
+            Similarity score (0-1)
+        """
+        embeddings = self.encode([text1, text2], normalize=True)
+        return float(embeddings[0] @ embeddings[1])
+    
+    def compute_similarity_matrix(self, texts1: List[str],
+                                   texts2: List[str]) -> np.ndarray:
+        """
+        Compute similarity matrix between two lists of texts
+        
+        Args:
+            texts1: First list of texts
+            texts2: Second list of texts
+            
+        Returns:
+            Similarity matrix (len(texts1) x len(texts2))
+        """
+        embeddings = self.encode(list(texts1) + list(texts2), normalize=True)
+        return embeddings[:len(texts1)] @ embeddings[len(texts1):].T
+
+
 class BERTModel:
     """Handles BERT-based contextual embeddings"""
     
@@ -150,15 +282,26 @@ class BERTModel:
 class SemanticMatcher:
     """High-level semantic matching interface"""
     
-    def __init__(self, use_sbert: bool = True, use_bert: bool = False):
+    def __init__(self, use_sbert: bool = True, use_bert: bool = False,
+                 quantize: bool = False, embedding_url: Optional[str] = None,
+                 compile: bool = False):
         """
         Initialize semantic matcher
         
         Args:
             use_sbert: Use Sentence-BERT (recommended)
             use_bert: Use standard BERT (optional, for comparison)
+            quantize: Use int8 dynamic quantization for SBERT on CPU
+            embedding_url: URL of a TEI server serving the SBERT model;
+                when set, embeddings are computed remotely instead of in-process
+            compile: Compile the SBERT forward with torch.compile
         """
-        self.sbert_model = EmbeddingModel() if use_sbert else None
+        if not use_sbert:
+            self.sbert_model = None
+        elif embedding_url:
+            self.sbert_model = TEIEmbeddingModel(embedding_url)
+        else:
+            self.sbert_model = EmbeddingModel(quantize=quantize, compile=compile)
         self.bert_model = BERTModel() if use_bert else None
     
     def match_resume_to_job(self, resume_text: str, 
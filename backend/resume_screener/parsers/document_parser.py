@@ -3,9 +3,13 @@ Document Parser for Resume and Job Description Processing
 Supports PDF, DOCX, and TXT formats
 """
 
+import hashlib
+import io
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union, BinaryIO
 import logging
 
 try:
@@ -31,20 +35,23 @@ class DocumentParser:
     """Parse various document formats to extract text"""
     
     @staticmethod
-    def parse_pdf_pypdf2(file_path: str) -> str:
-        """Parse PDF using PyPDF2"""
+    def parse_pdf_pypdf2(file_path: Union[str, BinaryIO]) -> str:
+        """Parse PDF using PyPDF2 (path or binary file object)"""
         if PyPDF2 is None:
             raise ImportError("PyPDF2 not installed. Install with: pip install PyPDF2")
         
+        if isinstance(file_path, (str, Path)):
+            with open(file_path, 'rb') as file:
+                return DocumentParser.parse_pdf_pypdf2(file)
+        
         text = ""
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+        reader = PyPDF2.PdfReader(file_path)
+        for page in reader.pages:
+            text += page.extract_text() + "\n"
         return text
     
     @staticmethod
-    def parse_pdf_pdfplumber(file_path: str) -> str:
+    def parse_pdf_pdfplumber(file_path: Union[str, BinaryIO]) -> str:
         """Parse PDF using pdfplumber (better for complex layouts)"""
         if pdfplumber is None:
             raise ImportError("pdfplumber not installed. Install with: pip install pdfplumber")
@@ -58,7 +65,7 @@ class DocumentParser:
         return text
     
     @staticmethod
-    def parse_docx(file_path: str) -> str:
+    def parse_docx(file_path: Union[str, BinaryIO]) -> str:
         """Parse DOCX file"""
         if Document is None:
             raise ImportError("python-docx not installed. Install with: pip install python-docx")
@@ -93,21 +100,11 @@ class DocumentParser:
         extension = path.suffix.lower()
         
         try:
-            if extension == '.pdf':
-                if use_pdfplumber and pdfplumber:
-                    logger.info(f"Parsing PDF with pdfplumber: {file_path}")
-                    text = cls.parse_pdf_pdfplumber(file_path)
-                else:
-                    logger.info(f"Parsing PDF with PyPDF2: {file_path}")
-                    text = cls.parse_pdf_pypdf2(file_path)
-            elif extension == '.docx':
-                logger.info(f"Parsing DOCX: {file_path}")
-                text = cls.parse_docx(file_path)
-            elif extension == '.txt':
+            if extension == '.txt':
                 logger.info(f"Parsing TXT: {file_path}")
                 text = cls.parse_txt(file_path)
             else:
-                raise ValueError(f"Unsupported file format: {extension}")
+                text = cls._parse_binary(file_path, extension, use_pdfplumber, str(file_path))
             
             # Clean and normalize text
             text = cls.clean_text(text)
@@ -117,6 +114,52 @@ class DocumentParser:
             logger.error(f"Error parsing {file_path}: {str(e)}")
             raise
     
+    @classmethod
+    def parse_bytes(cls, data: bytes, extension: str, use_pdfplumber: bool = True) -> str:
+        """
+        Parse an in-memory document (e.g. an uploaded file) without touching disk
+        
+        Args:
+            data: Raw file content
+            extension: File extension including the dot (e.g. '.pdf')
+            use_pdfplumber: Use pdfplumber for PDFs (better quality)
+            
+        Returns:
+            Extracted text
+        """
+        extension = extension.lower()
+        
+        try:
+            if extension == '.txt':
+                logger.info("Parsing TXT from memory")
+                text = data.decode('utf-8', errors='ignore')
+            else:
+                text = cls._parse_binary(io.BytesIO(data), extension, use_pdfplumber, 'memory')
+            
+            return cls.clean_text(text)
+            
+        except Exception as e:
+            logger.error(f"Error parsing {extension} document from memory: {str(e)}")
+            raise
+    
+    @classmethod
+    def _parse_binary(cls,
+                      source: Union[str, BinaryIO],
+                      extension: str,
+                      use_pdfplumber: bool,
+                      label: str) -> str:
+        """Dispatch PDF/DOCX parsing for a path or binary file object"""
+        if extension == '.pdf':
+            if use_pdfplumber and pdfplumber:
+                logger.info(f"Parsing PDF with pdfplumber: {label}")
+                return cls.parse_pdf_pdfplumber(source)
+            logger.info(f"Parsing PDF with PyPDF2: {label}")
+            return cls.parse_pdf_pypdf2(source)
+        elif extension == '.docx':
+            logger.info(f"Parsing DOCX: {label}")
+            return cls.parse_docx(source)
+        raise ValueError(f"Unsupported file format: {extension}")
+    
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize extracted text"""
@@ -147,8 +190,39 @@ class ResumeParser:
         """
         # Extract raw text
         raw_text = self.document_parser.parse(file_path)
+        return self._structure(raw_text)
+    
+    def parse_bytes(self, data: bytes, extension: str) -> Dict[str, Any]:
+        """
+        Parse an in-memory resume file and extract structured data
         
-        # Extract structured information
+        Args:
+            data: Raw file content
+            extension: File extension including the dot (e.g. '.pdf')
+            
+        Returns:
+            Dictionary with parsed resume data
+        """
+        raw_text = self.document_parser.parse_bytes(data, extension)
+        return self._structure(raw_text)
+    
+    def parse_text(self, text: str) -> Dict[str, Any]:
+        """
+        Parse plain resume text and extract structured data
+        
+        Equivalent to parsing the same text from a .txt file, without the
+        file round trip.
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            Dictionary with parsed resume data
+        """
+        return self._structure(self.document_parser.clean_text(text))
+    
+    def _structure(self, raw_text: str) -> Dict[str, Any]:
+        """Extract structured information from resume text"""
         result = {
             'raw_text': raw_text,
             'email': self._extract_email(raw_text),
@@ -251,6 +325,12 @@ class ResumeParser:
 class JobDescriptionParser:
     """Parse and extract structured information from job descriptions"""
     
+    # Parsed job text is memoized across instances: the same posting is
+    # typically screened against many resumes
+    CACHE_SIZE = 1024
+    _cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     def __init__(self):
         self.document_parser = DocumentParser()
     
@@ -264,20 +344,34 @@ class JobDescriptionParser:
         Returns:
             Dictionary with parsed job data
         """
-        # Check if input is a file path
+        # Check if input is a file path (files may change, so never cached)
         if Path(text_or_path).exists():
-            raw_text = self.document_parser.parse(text_or_path)
-        else:
-            raw_text = text_or_path
+            return self._parse_text(self.document_parser.parse(text_or_path))
         
-        result = {
+        key = hashlib.blake2b(text_or_path.encode('utf-8'), digest_size=16).digest()
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+        
+        if result is None:
+            result = self._parse_text(text_or_path)
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        # Callers get their own copy so the cached entry cannot be mutated
+        return {**result, 'sections': dict(result['sections'])}
+    
+    def _parse_text(self, raw_text: str) -> Dict[str, Any]:
+        """Extract structured fields from job description text"""
+        return {
             'raw_text': raw_text,
             'job_title': self._extract_job_title(raw_text),
             'required_experience': self._extract_experience_requirement(raw_text),
             'sections': self._identify_sections(raw_text)
         }
-        
-        return result
     
     @staticmethod
     def _extract_job_title(text: str) -> Optional[str]:
@@ -291,6 +291,35 @@ class SkillExtractor:
                 return sorted(list(all_skills))
             return pattern_skills
     
+    def extract_many(self, texts: List[str], method: str = 'hybrid',
+                     batch_size: int = 32) -> List[List[str]]:
+        """
+        Extract skills from several texts
+        
+        Same results as calling extract() per text, but the spaCy NER pass
+        runs through nlp.pipe so the texts are processed in batches.
+        
+        Args:
+            texts: Input texts
+            method: Extraction method ('pattern', 'ner', 'hybrid')
+            batch_size: spaCy pipe batch size
+            
+        Returns:
+            List of extracted skill lists, in input order
+        """
+        if not self.nlp or method == 'pattern':
+            return [self.extract(text, method='pattern') for text in texts]
+        
+        docs = self.nlp.pipe(texts, batch_size=batch_size)
+        if method == 'ner':
+            return [self._skills_from_doc(doc) for doc in docs]
+        
+        # hybrid
+        return [
+            sorted(set(self._extract_by_pattern(text)) | set(self._skills_from_doc(doc)))
+            for text, doc in zip(texts, docs)
+        ]
+    
     def _extract_by_pattern(self, text: str) -> List[str]:
         """Extract skills using pattern matching"""
         found_skills = set()
@@ -361,7 +390,10 @@ class SkillExtractor:
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
+        return self._skills_from_doc(self.nlp(text))
+    
+    def _skills_from_doc(self, doc) -> List[str]:
+        """Collect known skills from a spaCy doc's entities and noun chunks"""
         found_skills = set()
         
         # Extract entities that might be skills